@@ -0,0 +1,84 @@
+"""
+Measures the cold import of jobspy with python -X importtime.
+
+    python benchmarks/bench_import.py [--runs 5] [--top 15] [--output results.jsonl]
+
+Reports the median cumulative import time of jobspy, the slowest modules and
+whether any dependency that should load lazily was imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# the checkout whose jobspy is imported
+ROOT = Path(__file__).resolve().parent.parent
+
+LAZY_MODULES = ("pandas", "numpy", "tls_client", "bs4", "markdownify", "regex")
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """
+    :return: module -> (self, cumulative) import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            times[module] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statement", default="import jobspy")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="JSON lines file the result is appended to")
+    args = parser.parse_args()
+
+    runs = [import_times(args.statement) for _ in range(args.runs)]
+    package = args.statement.split()[-1].split(".")[0]
+    totals = [run.get(package, (0, 0))[1] for run in runs]
+    last = runs[-1]
+    loaded_lazy = sorted(module for module in last if module in LAZY_MODULES)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"{args.statement}: {median_ms:.1f} ms (median of {args.runs} runs)")
+    print(f"lazy dependencies imported: {', '.join(loaded_lazy) or 'none'}")
+    print("slowest modules (self, cumulative):")
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)
+    for module, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    if args.output:
+        with open(args.output, "a") as f:
+            record = {
+                "timestamp": time.time(),
+                "python": sys.version.split()[0],
+                "statement": args.statement,
+                "median_ms": median_ms,
+                "runs_ms": [total / 1000 for total in totals],
+                "lazy_imported": loaded_lazy,
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
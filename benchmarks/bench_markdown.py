@@ -0,0 +1,85 @@
+"""
+Compares the former description conversion (strip attributes, prettify, re-parse
+with markdownify) with markdown_converter converting the parsed Tag in one pass.
+
+    python benchmarks/bench_markdown.py [page.html ...]
+
+Pass saved LinkedIn job pages (or any HTML whose description sits in the LinkedIn
+markup div) to measure real descriptions, a sample description is used otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# run from a checkout, benchmark the jobspy next to this file
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+from jobspy.util import _to_markdown, remove_attributes
+
+SAMPLE = """
+<div class="show-more-less-html__markup relative overflow-hidden">
+  <p><strong>About the team</strong></p>
+  <p>We build the data platform behind <a href="https://example.com">our products</a>,
+  processing billions of events a day for teams across the company.</p>
+  <p><strong>What you'll do</strong></p>
+  <ul>
+    <li>Design, build and operate distributed services in Python and Go</li>
+    <li>Own features end to end, from design docs to on-call</li>
+    <li>Improve the performance and reliability of our ingestion pipelines</li>
+    <li>Mentor engineers and review code across the team</li>
+  </ul>
+  <p><strong>What we're looking for</strong></p>
+  <ul>
+    <li>5+ years of experience building backend systems</li>
+    <li>Experience with <em>Kafka</em>, <em>Spark</em> or similar systems</li>
+    <li>Strong knowledge of SQL and data modelling</li>
+  </ul>
+  <p>The base salary range for this role is $150,000 - $190,000 per year.</p>
+  <p>Contact <a href="mailto:jobs@example.com">jobs@example.com</a> with questions.</p>
+</div>
+"""
+
+
+def find_description(html: str):
+    soup = BeautifulSoup(html, "html.parser")
+    return (
+        soup.find("div", class_=lambda x: x and "show-more-less-html__markup" in x)
+        or soup
+    )
+
+
+def prettify_round_trip(tag) -> str:
+    return md(remove_attributes(tag).prettify(formatter="html")).strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("-n", "--number", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = [page.read_text() for page in args.pages] or [SAMPLE]
+    tags = [find_description(page) for page in pages]
+
+    before = timeit.timeit(
+        lambda: [prettify_round_trip(tag) for tag in tags], number=args.number
+    )
+    after = timeit.timeit(
+        lambda: [_to_markdown(tag) for tag in tags], number=args.number
+    )
+    conversions = args.number * len(tags)
+    print(f"descriptions: {len(tags)}, conversions: {conversions}")
+    print(f"prettify + markdownify: {before / conversions * 1e6:8.1f} us/description")
+    print(f"one pass from the Tag:  {after / conversions * 1e6:8.1f} us/description")
+    print(f"speed-up: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Measures the parsing throughput of every scraper offline against the responses in
+benchmarks/fixtures, and the DataFrame assembly of scrape_jobs.
+
+    python benchmarks/bench_scrapers.py [--runs 20] [--site linkedin ...]
+        [--output results.jsonl] [--baseline results.jsonl] [--tolerance 0.15]
+
+Each scraper runs its scrape() with its sessions answering from the fixtures, so the
+numbers cover the search page parsing, _process_job, detail page parsing, description
+conversion and model building but no network. --output appends the run to a JSON
+lines file, --baseline compares the run with the last record of such a file and
+exits with status 1 when a case got slower than the tolerance allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlencode
+
+# run from a checkout, benchmark the jobspy next to this file
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobspy import _create_jobs_output
+from jobspy.cache import HttpCache
+from jobspy.description import default_store
+from jobspy.model import JobResponse, ScraperInput, Site
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# site -> (method, url substring, body substring, fixture) answered in order, the
+# first matching route serves the request and anything else gets a 404
+ROUTES = {
+    Site.LINKEDIN: [
+        (
+            "GET",
+            "/jobs-guest/jobs/api/seeMoreJobPostings/search",
+            None,
+            "linkedin/search.html",
+        ),
+        ("GET", "/jobs/view/", None, "linkedin/job.html"),
+    ],
+    Site.INDEED: [
+        ("POST", "apis.indeed.com/graphql", None, "indeed/search.json"),
+    ],
+    Site.GLASSDOOR: [
+        ("GET", "/Job/computer-science-jobs.htm", None, "glassdoor/csrf.html"),
+        ("POST", "/graph", "JobSearchResultsQuery", "glassdoor/search.json"),
+        ("POST", "/graph", "JobDetailQuery", "glassdoor/detail.json"),
+    ],
+    Site.GOOGLE: [
+        ("GET", "google.com/search", None, "google/search.html"),
+        ("GET", "google.com/async/callback", None, "google/callback.txt"),
+    ],
+    Site.ZIP_RECRUITER: [
+        ("POST", "/jobs-app/event", None, None),
+        ("GET", "/jobs-app/jobs", None, "ziprecruiter/search.json"),
+        ("GET", "ziprecruiter.com/jobs//j?lvk=", None, "ziprecruiter/job.html"),
+    ],
+    Site.NAUKRI: [
+        ("GET", "naukri.com/jobapi/v3/search", None, "naukri/search.json"),
+    ],
+    Site.BDJOBS: [
+        ("GET", "jobsearch.asp", None, "bdjobs/search.html"),
+        ("GET", "jobdetails.asp", None, "bdjobs/job.html"),
+    ],
+    Site.BAYT: [
+        ("GET", "/en/international/jobs/", None, "bayt/search.html"),
+    ],
+}
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".txt": "application/json; charset=utf-8",
+}
+
+
+def json_dumps(obj) -> str:
+    return json.dumps(obj, sort_keys=True)
+
+
+class FixtureSession:
+    """
+    Stands in for the sessions of create_session, answering every request from the
+    fixture its route names
+    """
+
+    def __init__(self, routes: list[tuple]):
+        self.routes = routes
+        self.headers = {}
+        self.verify = True
+        self.reused = False
+        self.requests = 0
+        self.bytes = 0
+
+    def request(self, method: str, url: str, params=None, data=None, json=None, **_):
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+        body = data if data is not None else (json_dumps(json) if json else "")
+        if isinstance(body, bytes):
+            body = body.decode()
+        for route_method, url_part, body_part, fixture in self.routes:
+            if route_method != method.upper() or url_part not in url:
+                continue
+            if body_part and body_part not in str(body):
+                continue
+            content = (FIXTURES / fixture).read_bytes() if fixture else b""
+            content_type = (
+                CONTENT_TYPES.get(Path(fixture).suffix, "application/json")
+                if fixture
+                else "application/json"
+            )
+            headers = {"Content-Type": content_type}
+            status_code = 200
+            break
+        else:
+            content, headers, status_code = b"", {}, 404
+        self.requests += 1
+        self.bytes += len(content)
+        meta = {"url": url, "status_code": status_code, "headers": headers}
+        return HttpCache._build_response(meta, content)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+def scraper_input(site: Site) -> ScraperInput:
+    # results_wanted matches the jobs of a fixture page, so no scraper asks for a
+    # second page
+    return ScraperInput(
+        site_type=[site],
+        search_term="software engineer",
+        results_wanted=10,
+        linkedin_fetch_description=True,
+    )
+
+
+def bench_site(site: Site, runs: int) -> tuple[dict, list]:
+    """
+    :return: result of the site's runs and the jobs of its last run
+    """
+    scraper_class = site.scraper_class
+    module = sys.modules[scraper_class.__module__]
+    sessions = []
+
+    def create_session(*_, **__):
+        sessions.append(FixtureSession(ROUTES[site]))
+        return sessions[-1]
+
+    durations, jobs = [], []
+    with mock.patch.object(module, "create_session", create_session):
+        for _ in range(runs):
+            default_store.clear()
+            scraper = scraper_class()
+            start = time.perf_counter()
+            jobs = scraper.scrape(scraper_input(site)).jobs
+            durations.append(time.perf_counter() - start)
+    if not jobs:
+        raise RuntimeError(f"{site.value} parsed no jobs from its fixtures")
+    total = sum(durations)
+    return {
+        "jobs": len(jobs),
+        "requests": sum(session.requests for session in sessions) // runs,
+        "bytes": sum(session.bytes for session in sessions) // runs,
+        "median_ms": statistics.median(durations) * 1000,
+        "jobs_per_sec": len(jobs) * runs / total,
+    }, jobs
+
+
+def bench_frame(site_jobs: dict[Site, list], frame_jobs: int, runs: int) -> dict:
+    """
+    Times _create_jobs_output over the scraped jobs repeated to frame_jobs rows
+    """
+    per_site = max(frame_jobs // len(site_jobs), 1)
+    site_to_jobs = {
+        site.value: JobResponse(jobs=(jobs * (per_site // len(jobs) + 1))[:per_site])
+        for site, jobs in site_jobs.items()
+    }
+    rows = per_site * len(site_to_jobs)
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _create_jobs_output(
+            site_to_jobs, ScraperInput(site_type=list(site_jobs)), False
+        )
+        durations.append(time.perf_counter() - start)
+    return {
+        "jobs": rows,
+        "median_ms": statistics.median(durations) * 1000,
+        "jobs_per_sec": rows * runs / sum(durations),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def regressions(results: dict, baseline_path: str, tolerance: float) -> list[str]:
+    """
+    :return: the cases whose jobs/sec dropped more than tolerance below the last
+        record of baseline_path
+    """
+    with open(baseline_path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records:
+        return []
+    baseline = records[-1]["results"]
+    slower = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        before, after = baseline[case]["jobs_per_sec"], result["jobs_per_sec"]
+        if after < before * (1 - tolerance):
+            slower.append(f"{case}: {before:.1f} -> {after:.1f} jobs/s")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--site", action="append", choices=[site.value for site in ROUTES]
+    )
+    parser.add_argument("--frame-jobs", type=int, default=5000)
+    parser.add_argument("--output", help="JSON lines file the result is appended to")
+    parser.add_argument("--baseline", help="JSON lines file of earlier results")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    sites = [Site(site) for site in args.site] if args.site else list(ROUTES)
+    results, site_jobs = {}, {}
+    for site in sites:
+        results[site.value], site_jobs[site] = bench_site(site, args.runs)
+    results["scrape_jobs_frame"] = bench_frame(site_jobs, args.frame_jobs, args.runs)
+
+    print(f"{'case':<20} {'jobs':>6} {'requests':>8} {'median ms':>10} {'jobs/s':>10}")
+    for case, result in results.items():
+        print(
+            f"{case:<20} {result['jobs']:>6} {result.get('requests', ''):>8} "
+            f"{result['median_ms']:>10.2f} {result['jobs_per_sec']:>10.1f}"
+        )
+
+    slower = (
+        regressions(results, args.baseline, args.tolerance) if args.baseline else []
+    )
+    if args.output:
+        with open(args.output, "a") as f:
+            record = {
+                "timestamp": time.time(),
+                "revision": git_revision(),
+                "python": sys.version.split()[0],
+                "runs": args.runs,
+                "results": results,
+            }
+            f.write(json.dumps(record) + "\n")
+    if slower:
+        print("slower than the baseline:")
+        for line in slower:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
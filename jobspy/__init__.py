@@ -1,33 +1,70 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
-
-import pandas as pd
-
-from jobspy.bayt import BaytScraper
-from jobspy.bdjobs import BDJobs
-from jobspy.glassdoor import Glassdoor
-from jobspy.google import Google
-from jobspy.indeed import Indeed
-from jobspy.linkedin import LinkedIn
-from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import as_completed
+from contextlib import nullcontext
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Callable, Iterator, Tuple
+
+from jobspy.cache import HttpCache
+from jobspy.replay import HttpArchive
+from jobspy.retry import RetryPolicy
+from jobspy.description import DescriptionStore
+from jobspy.hedge import HedgePolicy
+from jobspy.scheduler import Scheduler
+from jobspy.pool import SessionPool
+from jobspy.proxies import ProxyPool
+from jobspy.seen import SeenStore
+from jobspy import tracing
+from jobspy.profiler import SamplingProfiler, profiled
+from jobspy.stats import ScrapeStats
+from jobspy.tracing import JsonLinesExporter, SpanExporter, set_trace_exporter
+from jobspy.model import JobType, JobPost, Location, JobResponse, Country
+from jobspy.model import SalarySource, ScraperInput, Site, SCRAPER_CLASSES
+from jobspy.model import set_strict_validation
 from jobspy.util import (
+    set_html_parser,
     set_logger_level,
-    extract_salary,
     create_logger,
     get_enum_from_value,
     map_str_to_site,
-    convert_to_annual,
     desired_order,
 )
-from jobspy.ziprecruiter import ZipRecruiter
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from jobspy.frame import JobColumns
+
+# attributes imported on first access, keeping pandas, numpy and the scrapers
+# (with bs4, markdownify, regex and tls_client) out of "import jobspy"
+_LAZY_ATTRIBUTES = {
+    "dedupe_jobs": ("jobspy.dedup", "dedupe_jobs"),
+    "duplicate_groups": ("jobspy.dedup", "duplicate_groups"),
+    "derive_salaries": ("jobspy.salary", "derive_salaries"),
+    **{
+        class_name: (module, class_name)
+        for module, class_name in SCRAPER_CLASSES.values()
+    },
+}
 
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+def __getattr__(name: str):
+    if name == "SCRAPER_MAPPING":
+        return {site: site.scraper_class for site in Site}
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
 
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        return getattr(importlib.import_module(module_name), attribute)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@profiled
+@tracing.traced("scrape_jobs")
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
     search_term: str | None = None,
@@ -39,7 +76,7 @@ def scrape_jobs(
     easy_apply: bool | None = None,
     results_wanted: int = 15,
     country_indeed: str = "usa",
-    proxies: list[str] | str | None = None,
+    proxies: list[str] | str | ProxyPool | None = None,
     ca_cert: str | None = None,
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
@@ -49,25 +86,227 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    scheduler: Scheduler | None = None,
+    cache: HttpCache | None = None,
+    description_store: DescriptionStore | None = None,
+    seen: SeenStore | None = None,
+    archive: HttpArchive | None = None,
+    stats: ScrapeStats | None = None,
+    session_pool: SessionPool | None = None,
+    retry: RetryPolicy | None = None,
+    hedge: HedgePolicy | None = None,
+    dedupe: str | None = None,
+    output_format: str = "pandas",
+    output_path: str | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
-    """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
+    :return: Pandas DataFrame containing job data, or with output_format "arrow",
+        "polars", "parquet" or "ipc" a pyarrow Table / Polars DataFrame / the pyarrow
+        Table written to output_path
+    """
+    start = time.perf_counter()
+    set_logger_level(verbose)
+    _check_output_format(output_format, output_path)
+    scraper_input, scraper_kwargs = _prepare_scrape(locals())
+    scheduler = scraper_kwargs["scheduler"]
+
+    site_to_jobs_dict = {}
+
+    future_to_site = {
+        scheduler.submit_site(
+            _scrape_site, site, scraper_input, scraper_kwargs, stats=stats
+        ): site
+        for site in scraper_input.site_type
     }
+
+    for future in as_completed(future_to_site):
+        site_value, scraped_data = future.result()
+        site_to_jobs_dict[site_value] = scraped_data
+
+    jobs = _create_jobs_output(
+        site_to_jobs_dict,
+        scraper_input,
+        enforce_annual_salary,
+        description_store=description_store,
+        dedupe=dedupe,
+        output_format=output_format,
+        output_path=output_path,
+        stats=stats,
+    )
+    return _finish_stats(stats, start, jobs)
+
+
+@profiled
+def scrape_jobs_iter(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    scheduler: Scheduler | None = None,
+    cache: HttpCache | None = None,
+    description_store: DescriptionStore | None = None,
+    seen: SeenStore | None = None,
+    archive: HttpArchive | None = None,
+    stats: ScrapeStats | None = None,
+    session_pool: SessionPool | None = None,
+    retry: RetryPolicy | None = None,
+    hedge: HedgePolicy | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Scrapes job data from job boards concurrently, yielding each scraped page as soon
+    as it is parsed instead of waiting for every site to finish.
+    Batches have the same columns and normalization as scrape_jobs, jobs keep the
+    order each site returned them in.
+    :return: generator of Pandas DataFrames, one per scraped page
+    """
+    start = time.perf_counter()
     set_logger_level(verbose)
-    job_type = get_enum_from_value(job_type) if job_type else None
+    scraper_input, scraper_kwargs = _prepare_scrape(locals())
+    scheduler = scraper_kwargs["scheduler"]
+    # a consumer that falls behind holds the scrapers back instead of letting the
+    # batches pile up, and one that stops iterating stops them
+    batches: Queue[tuple[Site, list[JobPost] | None]] = Queue(
+        maxsize=2 * len(scraper_input.site_type)
+    )
+    stop = threading.Event()
+    # a generator can't keep a span active across its yields, so the sites' spans
+    # get the root span explicitly
+    root_span = tracing.start_span("scrape_jobs_iter")
+
+    def put(item: tuple[Site, list[JobPost] | None]):
+        while not stop.is_set():
+            try:
+                return batches.put(item, timeout=0.1)
+            except Full:
+                pass
+
+    def worker(site: Site):
+        try:
+            with tracing.activate(root_span):
+                return _scrape_site(
+                    site,
+                    scraper_input,
+                    scraper_kwargs,
+                    on_jobs=lambda jobs: put((site, jobs)),
+                    stats=stats,
+                    stop=stop,
+                )
+        finally:
+            put((site, None))
+
+    future_to_site = {
+        site: scheduler.submit_site(worker, site) for site in scraper_input.site_type
+    }
+    try:
+        remaining = len(future_to_site)
+        while remaining:
+            site, batch = batches.get()
+            if batch is None:
+                remaining -= 1
+                future_to_site[site].result()
+                continue
+            from jobspy.frame import JobColumns
+
+            jobs = JobColumns(
+                country=scraper_input.country,
+                enforce_annual_salary=enforce_annual_salary,
+                description_store=description_store,
+            )
+            jobs.add_jobs(site.value, batch)
+            yield jobs.to_pandas()
+    finally:
+        stop.set()
+        for future in future_to_site.values():
+            future.cancel()
+        _finish_stats(stats, start)
+        if root_span is not None:
+            root_span.end()
+
+
+async def async_scrape_jobs(*args, **kwargs) -> pd.DataFrame:
+    """
+    Coroutine version of scrape_jobs, taking the same arguments. The scrape itself
+    stays blocking and runs in a worker thread through asyncio.to_thread, so the
+    event loop is free while it runs and several searches can be gathered on it.
+    There is no async transport: every scraper and the session layer are built on
+    requests/tls_client, and their detail fetches fan out on the Scheduler's pool.
+    :return: Pandas DataFrame containing job data, or the output_format's table
+    """
+    return await asyncio.to_thread(scrape_jobs, *args, **kwargs)
 
+
+async_scrape_jobs.__signature__ = inspect.signature(scrape_jobs)
+
+
+# parameters of scrape_jobs and scrape_jobs_iter that make up the ScraperInput
+_INPUT_PARAMETERS = (
+    "site_name",
+    "search_term",
+    "google_search_term",
+    "location",
+    "distance",
+    "is_remote",
+    "job_type",
+    "easy_apply",
+    "results_wanted",
+    "country_indeed",
+    "description_format",
+    "linkedin_fetch_description",
+    "linkedin_company_ids",
+    "offset",
+    "hours_old",
+)
+
+
+def _prepare_scrape(params: dict) -> tuple[ScraperInput, dict]:
+    """
+    Builds the input of a scrape and the kwargs of its scrapers
+    :param params: the arguments of scrape_jobs or scrape_jobs_iter, as in locals()
+    :return: the ScraperInput and the kwargs every site's Scraper is created with
+    """
+    scraper_input = _create_scraper_input(
+        **{name: params[name] for name in _INPUT_PARAMETERS}
+    )
+    scraper_kwargs = dict(
+        proxies=params["proxies"],
+        ca_cert=params["ca_cert"],
+        user_agent=params["user_agent"],
+        scheduler=params["scheduler"] or Scheduler.default(),
+        cache=params["cache"],
+        seen=params["seen"],
+        archive=params["archive"],
+        session_pool=params["session_pool"] or SessionPool.default(),
+        retry=params["retry"] or RetryPolicy(),
+        hedge=params["hedge"],
+    )
+    return scraper_input, scraper_kwargs
+
+
+def _create_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    job_type: str | None,
+    country_indeed: str,
+    **kwargs,
+) -> ScraperInput:
     def get_site_type():
         site_types = list(Site)
         if isinstance(site_name, str):
@@ -81,139 +320,180 @@ def scrape_jobs(
             ]
         return site_types
 
-    country_enum = Country.from_string(country_indeed)
-
-    scraper_input = ScraperInput(
+    return ScraperInput(
         site_type=get_site_type(),
-        country=country_enum,
-        search_term=search_term,
-        google_search_term=google_search_term,
-        location=location,
-        distance=distance,
-        is_remote=is_remote,
-        job_type=job_type,
-        easy_apply=easy_apply,
-        description_format=description_format,
-        linkedin_fetch_description=linkedin_fetch_description,
-        results_wanted=results_wanted,
-        linkedin_company_ids=linkedin_company_ids,
-        offset=offset,
-        hours_old=hours_old,
+        country=Country.from_string(country_indeed),
+        job_type=get_enum_from_value(job_type) if job_type else None,
+        **kwargs,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
 
-    site_to_jobs_dict = {}
+def _scrape_site(
+    site: Site,
+    scraper_input: ScraperInput,
+    scraper_kwargs: dict,
+    on_jobs: Callable[[list[JobPost]], None] | None = None,
+    stats: ScrapeStats | None = None,
+    stop: threading.Event | None = None,
+) -> Tuple[str, JobResponse]:
+    """
+    Runs the scraper of a site. With on_jobs, every job of the response is passed to it
+    exactly once, page by page as the scraper emits them. Once stop is set the scraper
+    returns after its current page.
+    """
+    with _collect_stats(stats, site) as site_stats, _site_span(site) as span:
+        scraper_class = site.scraper_class
+        scraper = scraper_class(**scraper_kwargs)
+        scraper.on_jobs = on_jobs
+        scraper.stop_event = stop
+        try:
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
+        finally:
+            scraper.close()
+        _count_jobs(site_stats, span, scraped_data)
+    if (
+        on_jobs is not None
+        and not scraper.stopped
+        and scraper.jobs_emitted < len(scraped_data.jobs)
+    ):
+        on_jobs(scraped_data.jobs[scraper.jobs_emitted :])
+    _remember_jobs(scraper, scraped_data)
+    _log_finished(site)
+    return site.value, scraped_data
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
+
+def _collect_stats(stats: ScrapeStats | None, site: Site):
+    return stats.collect(site.value) if stats is not None else nullcontext()
+
+
+def _site_span(site: Site):
+    return tracing.span("scrape_site", **{"jobspy.site": site.value})
+
+
+def _count_jobs(site_stats, span, scraped_data: JobResponse):
+    if site_stats is not None:
+        site_stats.count("jobs", len(scraped_data.jobs))
+    if span is not None:
+        span.set("jobspy.jobs", len(scraped_data.jobs))
+
+
+def _finish_stats(stats: ScrapeStats | None, start: float, jobs=None):
+    """
+    Records the wall time of a call and attaches the stats to a pandas result
+    """
+    if stats is not None:
+        stats.wall_time += time.perf_counter() - start
+        if hasattr(jobs, "attrs"):
+            jobs.attrs["stats"] = stats.to_dict()
+    return jobs
+
+
+def _remember_jobs(scraper, scraped_data: JobResponse):
+    """
+    In incremental mode, records the returned jobs so later runs skip them
+    """
+    if scraper.seen is not None:
+        scraper.seen.add(job.id for job in scraped_data.jobs)
+
+
+def _log_finished(site: Site):
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
+    create_logger(site_name).info(f"finished scraping")
+
+
+def _check_output_format(output_format: str, output_path: str | None):
+    from jobspy.frame import OUTPUT_FORMATS
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output_format: {output_format}, expected one of {OUTPUT_FORMATS}"
+        )
+    if output_format in ("parquet", "ipc") and not output_path:
+        raise ValueError(f"output_format {output_format} requires an output_path")
+
+
+@tracing.traced
+def _create_jobs_output(
+    site_to_jobs_dict: dict[str, JobResponse],
+    scraper_input: ScraperInput,
+    enforce_annual_salary: bool,
+    description_store: DescriptionStore | None = None,
+    dedupe: str | None = None,
+    output_format: str = "pandas",
+    output_path: str | None = None,
+    stats: ScrapeStats | None = None,
+):
+    """
+    Builds the result of a scrape in output_format, sorted by site and newest first.
+    Arrow based formats are built from typed column buffers without going through
+    pandas, unless dedupe needs the DataFrame. Either way the table is typed by
+    arrow_schema.
+    """
+    from jobspy.frame import JobColumns, SORT_KEYS, arrow_schema, write_table
+
+    start = time.perf_counter()
+    try:
+        jobs = JobColumns(
+            country=scraper_input.country,
+            enforce_annual_salary=enforce_annual_salary,
+            description_store=description_store,
+        )
+        for site, job_response in site_to_jobs_dict.items():
+            jobs.add_jobs(site, job_response.jobs)
+
+        if output_format == "pandas" or dedupe:
+            jobs_df = _create_jobs_df(jobs)
+            if dedupe:
+                jobs_df = _dedupe_jobs_df(jobs_df, dedupe, stats)
+            if output_format == "pandas":
+                return jobs_df
+            import pyarrow as pa
+
+            schema = arrow_schema(duplicate_group=True)
+            if jobs_df.empty:
+                table = schema.empty_table()
             else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
+                table = pa.Table.from_pandas(
+                    jobs_df, schema=schema, preserve_index=False
+                )
+        else:
+            table = jobs.to_arrow().sort_by(SORT_KEYS)
+            del jobs  # frees the column lists before converting or writing the table
+
+        if output_format == "polars":
+            import polars as pl
+
+            return pl.from_arrow(table)
+        if output_format in ("parquet", "ipc"):
+            write_table(table, output_format, output_path)
+        return table
+    finally:
+        if stats is not None:
+            stats.output_time += time.perf_counter() - start
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
+def _dedupe_jobs_df(jobs_df: pd.DataFrame, dedupe: str, stats: ScrapeStats | None):
+    from jobspy.dedup import dedupe_jobs
 
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    if stats is None or jobs_df.empty:
+        return dedupe_jobs(jobs_df, dedupe)
+    before = jobs_df["site"].value_counts()
+    jobs_df = dedupe_jobs(jobs_df, dedupe)
+    after = jobs_df["site"].value_counts()
+    for site, rows in before.items():
+        stats.site(site).count("duplicates_dropped", int(rows - after.get(site, 0)))
+    return jobs_df
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
 
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
+def _create_jobs_df(jobs: JobColumns) -> pd.DataFrame:
+    import pandas as pd
 
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+    if len(jobs):
+        jobs_df = jobs.to_pandas()
 
-        # Step 4: Sort the DataFrame as required
+        # Sort the DataFrame as required
         return jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
         ).reset_index(drop=True)
@@ -224,4 +504,26 @@ def scrape_jobs(
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
+    "scrape_jobs",
+    "scrape_jobs_iter",
+    "async_scrape_jobs",
+    "Scheduler",
+    "HttpCache",
+    "HttpArchive",
+    "DescriptionStore",
+    "SeenStore",
+    "SessionPool",
+    "ProxyPool",
+    "RetryPolicy",
+    "HedgePolicy",
+    "ScrapeStats",
+    "SpanExporter",
+    "JsonLinesExporter",
+    "set_trace_exporter",
+    "SamplingProfiler",
+    "dedupe_jobs",
+    "duplicate_groups",
+    "set_html_parser",
+    "set_strict_validation",
+    "derive_salaries",
 ]
\ No newline at end of file
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import random
-import time
+import hashlib
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from jobspy import tracing
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -14,20 +14,23 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, create_session, parse_response
 
 log = create_logger("Bayt")
 
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
+    rate_limit = 0.3  # initial search page requests per second, adapted to responses
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
-        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
@@ -35,7 +38,12 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            rate_limit=self.rate_limit,
+            **self.session_options,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -43,7 +51,7 @@ class BaytScraper(Scraper):
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while len(job_list) < results_wanted and not self.stopped:
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -71,25 +79,29 @@ class BaytScraper(Scraper):
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
 
+            self.emit_jobs(job_list)
             if len(job_list) == initial_count:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    @tracing.traced
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
         Grabs the job results for the given query and page number.
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
-            response = self.session.get(url)
+            response = self.session.get(url, kind="search")
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            # only the job cards are parsed
+            soup = parse_response(
+                response, parse_only=SoupStrainer("li", attrs={"data-js-job": True})
+            )
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
@@ -110,6 +122,10 @@ class BaytScraper(Scraper):
         job_url = self._extract_job_url(job_general_information)
         if not job_url:
             return
+        # stable across runs, so incremental runs recognize the job
+        job_id = f"bayt-{hashlib.md5(job_url.encode()).hexdigest()[:16]}"
+        if self.known_ids([job_id]):
+            return
 
         # Extract company name using the original approach:
         company_tag = job.find("div", class_="t-nowrap p10l")
@@ -123,12 +139,11 @@ class BaytScraper(Scraper):
         location_tag = job.find("div", class_="t-mute t-small")
         location = location_tag.get_text(strip=True) if location_tag else None
 
-        job_id = f"bayt-{abs(hash(job_url))}"
-        location_obj = Location(
+        location_obj = Location.create(
             city=location,
             country=Country.from_string(self.country),
         )
-        return JobPost(
+        return JobPost.create(
             id=job_id,
             title=job_title,
             company_name=company_name,
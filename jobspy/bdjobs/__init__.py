@@ -1,15 +1,14 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
+import hashlib
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from jobspy import stats, tracing
 from jobspy.exception import BDJobsException
 from jobspy.bdjobs.constant import headers, search_params
 from jobspy.bdjobs.util import (
@@ -34,6 +33,7 @@ from jobspy.util import (
     create_logger,
     remove_attributes,
     markdown_converter,
+    parse_response,
 )
 
 log = create_logger("BDJobs")
@@ -42,23 +42,27 @@ log = create_logger("BDJobs")
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
-    delay = 2
-    band_delay = 3
+    rate_limit = 0.3  # initial search page requests per second, adapted to responses
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
         """
-        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
             has_retry=True,
-            delay=5,
             clear_cookies=True,
+            rate_limit=self.rate_limit,
+            **self.session_options,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -80,7 +84,9 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
+        continue_search = (
+            lambda: len(job_list) < scraper_input.results_wanted and not self.stopped
+        )
 
         while continue_search():
             request_count += 1
@@ -95,13 +101,14 @@ class BDJobs(Scraper):
                     self.search_url,
                     params=params,
                     timeout=getattr(scraper_input, "request_timeout", 60),
+                    kind="search",
                 )
 
                 if response.status_code != 200:
                     log.error(f"BDJobs response status code {response.status_code}")
                     break
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = parse_response(response)
                 job_cards = find_job_listings(soup)
 
                 if not job_cards or len(job_cards) == 0:
@@ -110,21 +117,34 @@ class BDJobs(Scraper):
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
 
-                for job_card in job_cards:
-                    try:
-                        job_post = self._process_job(job_card)
-                        if job_post and job_post.id not in seen_ids:
-                            seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
-                                break
-                    except Exception as e:
-                        log.error(f"Error processing job card: {str(e)}")
-
+                # known jobs are dropped before their details are fetched
+                card_ids = [self._card_job_id(job_card) for job_card in job_cards]
+                known = self.known_ids([job_id for job_id in card_ids if job_id])
+                if known and known.issuperset(card_ids):
+                    log.info("Page holds only known jobs, stopping")
+                    break
+                job_cards = [
+                    job_card
+                    for job_card, job_id in zip(job_cards, card_ids)
+                    if job_id not in known
+                ]
+
+                # details are fetched concurrently, a batch at most as large as
+                # the number of jobs still wanted at a time
+                while job_cards and continue_search():
+                    remaining = scraper_input.results_wanted - len(job_list)
+                    batch, job_cards = job_cards[:remaining], job_cards[remaining:]
+                    for job_post in self.scheduler.map(self._process_job, batch):
+                        if not job_post:
+                            continue
+                        if job_post.id in seen_ids:
+                            stats.count("duplicates_dropped")
+                            continue
+                        seen_ids.add(job_post.id)
+                        job_list.append(job_post)
+
+                self.emit_jobs(job_list)
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
@@ -133,6 +153,27 @@ class BDJobs(Scraper):
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    @staticmethod
+    def _get_job_link(job_card: Tag) -> Optional[Tag]:
+        return job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+
+    def _get_job_url_and_id(self, job_link: Tag) -> tuple[str, str]:
+        job_url = job_link.get("href")
+        if not job_url.startswith("http"):
+            job_url = urljoin(self.base_url, job_url)
+
+        # Extract job ID from URL
+        job_id = (
+            job_url.split("jobid=")[-1].split("&")[0]
+            if "jobid=" in job_url
+            else f"bdjobs-{hashlib.md5(job_url.encode()).hexdigest()[:16]}"
+        )
+        return job_url, job_id
+
+    def _card_job_id(self, job_card: Tag) -> Optional[str]:
+        job_link = self._get_job_link(job_card)
+        return self._get_job_url_and_id(job_link)[1] if job_link else None
+
     def _process_job(self, job_card: Tag) -> Optional[JobPost]:
         """
         Processes a job card element into a JobPost object
@@ -141,20 +182,10 @@ class BDJobs(Scraper):
         """
         try:
             # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+            job_link = self._get_job_link(job_card)
             if not job_link:
                 return None
-
-            job_url = job_link.get("href")
-            if not job_url.startswith("http"):
-                job_url = urljoin(self.base_url, job_url)
-
-            # Extract job ID from URL
-            job_id = (
-                job_url.split("jobid=")[-1].split("&")[0]
-                if "jobid=" in job_url
-                else f"bdjobs-{hash(job_url)}"
-            )
+            job_url, job_id = self._get_job_url_and_id(job_link)
 
             # Extract title
             title = job_link.get_text(strip=True)
@@ -227,7 +258,7 @@ class BDJobs(Scraper):
             is_remote = is_job_remote(title, location=location)
 
             # Create job post object
-            job_post = JobPost(
+            job_post = JobPost.create(
                 id=job_id,
                 title=title,
                 company_name=company_name,  # Use company_name instead of company
@@ -248,6 +279,7 @@ class BDJobs(Scraper):
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    @tracing.traced
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Gets detailed job information from the job page
@@ -255,11 +287,11 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            response = self.session.get(job_url, timeout=60, kind="detail")
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_response(response)
 
             # Find job description - IMPROVED based on correct.py
             description = ""
@@ -306,14 +338,15 @@ class BDJobs(Scraper):
                     ),
                 )
                 if description_elem:
-                    description_elem = remove_attributes(description_elem)
-                    description = description_elem.prettify(formatter="html")
                     if (
                         hasattr(self.scraper_input, "description_format")
                         and self.scraper_input.description_format
                         == DescriptionFormat.MARKDOWN
                     ):
-                        description = markdown_converter(description)
+                        description = markdown_converter(description_elem)
+                    else:
+                        description_elem = remove_attributes(description_elem)
+                        description = description_elem.prettify(formatter="html")
 
             # Extract job type
             job_type_elem = soup.find(
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from jobspy.model import Location, Country
+from jobspy.util import TextFeatures, text_features
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -17,13 +18,13 @@ def parse_location(location_text: str, country: str = "bangladesh") -> Location:
     if len(parts) >= 2:
         city = parts[0].strip()
         state = parts[1].strip()
-        return Location(
+        return Location.create(
             city=city,
             state=state,
             country=Country.from_string(country)
         )
     else:
-        return Location(
+        return Location.create(
             city=location_text.strip(),
             country=Country.from_string(country)
         )
@@ -79,22 +80,22 @@ def find_job_listings(soup: BeautifulSoup) -> List[Any]:
     return []
 
 
-def is_job_remote(title: str, description: str = None, location: Location = None) -> bool:
+def is_job_remote(
+    title: str, features: TextFeatures = None, location: Location = None
+) -> bool:
     """
     Determines if a job is remote based on title, description, and location
     :param title: Job title
-    :param description: Job description
+    :param features: text_features of the job description, if it was fetched
     :param location: Job location
     :return: True if job is remote, False otherwise
     """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-    
-    # Combine all text fields
-    full_text = title.lower()
-    if description:
-        full_text += " " + description.lower()
+    texts = [title]
     if location:
-        full_text += " " + location.display_location().lower()
-    
-    # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
+        texts.append(location.display_location())
+
+    # Check each field for remote keywords
+    found = [text_features(text) for text in texts]
+    if features is not None:
+        found.append(features)
+    return any(f.is_remote or f.home_based for f in found)
\ No newline at end of file
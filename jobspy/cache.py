@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpCache:
+    """
+    Opt-in on-disk cache of successful responses, shared by sessions created with it.
+    Only requests tagged with a kind ("search" or "detail") are cached, each kind with
+    its own time to live. Entries are zlib-compressed files, the least recently used
+    ones are evicted once the store outgrows max_bytes.
+    """
+
+    def __init__(
+        self,
+        path: str = ".jobspy_cache",
+        search_ttl: float = 3600,
+        detail_ttl: float = 7 * 86400,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        :param path: directory of the store, created if missing
+        :param search_ttl: seconds a cached search page stays valid
+        :param detail_ttl: seconds a cached detail page stays valid
+        :param max_bytes: size of the store above which entries are evicted
+        """
+        self.path = path
+        self.ttls = {"search": search_ttl, "detail": detail_ttl}
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        # key -> (size on disk, last access) of every stored entry
+        self._index: dict[str, tuple[int, float]] = {}
+        for entry in os.scandir(path):
+            if entry.name.endswith(".z"):
+                stat = entry.stat()
+                self._index[entry.name[:-2]] = (stat.st_size, stat.st_mtime)
+        self._size = sum(size for size, _ in self._index.values())
+
+    @staticmethod
+    def key(
+        method: str, url: str, params=None, data=None, json_body=None, headers=None
+    ) -> str:
+        """
+        Fingerprints a request from its method, url, query params, body and the
+        headers passed with the request itself (not the session's defaults)
+        """
+        request = [method.upper(), url, params, data, json_body, headers]
+        encoded = json.dumps(request, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str, kind: str) -> requests.Response | None:
+        """
+        :return: the cached response if one younger than the kind's ttl exists
+        """
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                meta, content = self._decode(f.read())
+        except (OSError, ValueError, zlib.error):
+            with self._lock:
+                self.misses += 1
+            return None
+        if time.time() - meta["stored_at"] > self.ttls[kind]:
+            self._remove(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        now = time.time()
+        try:
+            os.utime(filename, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            if key in self._index:
+                self._index[key] = (self._index[key][0], now)
+        return self._build_response(meta, content)
+
+    def set(self, key: str, response):
+        """
+        Stores a response, responses that aren't successful are skipped
+        """
+        if not 200 <= response.status_code < 300:
+            return
+        meta = {
+            "stored_at": time.time(),
+            "url": str(response.url),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+        }
+        payload = zlib.compress(json.dumps(meta).encode() + b"\0" + response.content)
+        filename = self._filename(key)
+        tmp_filename = f"{filename}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_filename, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_filename, filename)
+        except OSError:
+            return
+        with self._lock:
+            previous_size, _ = self._index.get(key, (0, 0))
+            self._index[key] = (len(payload), time.time())
+            self._size += len(payload) - previous_size
+            self.stores += 1
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(self._index),
+            "bytes": self._size,
+        }
+
+    def clear(self):
+        for key in list(self._index):
+            self._remove(key)
+
+    def _evict(self):
+        """
+        Drops least recently used entries until the store is back under 90% of
+        max_bytes, must be called holding the lock
+        """
+        target = self.max_bytes * 0.9
+        for key, (size, _) in sorted(self._index.items(), key=lambda e: e[1][1]):
+            if self._size <= target:
+                break
+            try:
+                os.remove(self._filename(key))
+            except OSError:
+                pass
+            del self._index[key]
+            self._size -= size
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        try:
+            os.remove(self._filename(key))
+        except OSError:
+            pass
+        with self._lock:
+            size, _ = self._index.pop(key, (0, 0))
+            self._size -= size
+
+    def _filename(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.z")
+
+    @staticmethod
+    def _decode(payload: bytes) -> tuple[dict, bytes]:
+        meta, _, content = zlib.decompress(payload).partition(b"\0")
+        return json.loads(meta), content
+
+    @staticmethod
+    def _build_response(meta: dict, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.url = meta["url"]
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
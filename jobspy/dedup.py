@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import pandas as pd
+
+DEDUPE_MODES = ("group", "collapse")
+
+_COMPANY_SUFFIXES = (
+    r"\b(inc|incorporated|llc|l\.l\.c|ltd|limited|corp|corporation|co|company|"
+    r"gmbh|plc|pvt|private|llp|lp|sa|ag|bv)\b\.?"
+)
+
+
+def _normalize(values: pd.Series) -> pd.Series:
+    """
+    Lowercases, drops punctuation and collapses whitespace of a column of strings
+    """
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(r"[^\w\s]", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _normalize_company(values: pd.Series) -> pd.Series:
+    companies = values.fillna("").astype(str).str.lower()
+    companies = companies.str.replace(_COMPANY_SUFFIXES, " ", regex=True)
+    companies = _normalize(companies)
+    return companies.mask(companies == "n a", "")
+
+
+# query parameters that only tell where a visitor came from, every other parameter
+# may identify the job (jk, gh_jid, the requisition ids of ATS pages...)
+_TRACKING_PARAMS = frozenset(
+    (
+        "gclid",
+        "fbclid",
+        "msclkid",
+        "dclid",
+        "_ga",
+        "_gl",
+        "ref",
+        "referrer",
+        "refid",
+        "trk",
+        "trackingid",
+        "src",
+        "source",
+        "sourcetype",
+        "from",
+        "campaign",
+        "cmp",
+    )
+)
+_TRACKING_PREFIXES = ("utm_", "mc_", "_hs")
+
+
+def _url_key(url: str) -> str:
+    """
+    Reduces a url to host, path and sorted query parameters without the tracking
+    ones, so schemes, fragments, tracking and parameter order don't matter. Only the
+    host is case-insensitive, paths and query values may be case-sensitive ids.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ""
+    if not host:
+        return ""
+    host = host.removeprefix("www.")
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in _TRACKING_PARAMS and not name.startswith(_TRACKING_PREFIXES)
+    )
+    key = host + parts.path.rstrip("/")
+    return f"{key}?{urlencode(params)}" if params else key
+
+
+def _normalize_url(values: pd.Series) -> pd.Series:
+    urls = values.fillna("").astype(str)
+    keys = {url: _url_key(url) for url in urls.unique()}
+    return urls.map(keys)
+
+
+def _is_own_board_url(site: str, url_key: str) -> bool:
+    """
+    Whether a url points to the board the job was scraped from, e.g. the Indeed
+    viewjob page given as the direct url of an Indeed job. Such a url is the board's
+    listing rather than the employer's posting, so it never links jobs.
+    """
+    host = url_key.split("/", 1)[0]
+    return f".{site.replace('_', '')}." in f".{host}."
+
+
+def _blocking_keys(jobs: pd.DataFrame) -> list[pd.Series]:
+    """
+    :return: one key column per rule, rows sharing a non-empty key are duplicates
+    """
+    keys = []
+    if {"title", "company"}.issubset(jobs.columns):
+        title = _normalize(jobs["title"])
+        company = _normalize_company(jobs["company"])
+        if "location" in jobs.columns:
+            locations = jobs["location"].fillna("").astype(str)
+            city = _normalize(locations.str.split(",").str[0])
+        else:
+            city = pd.Series("", index=jobs.index)
+        posting = title + "|" + company + "|" + city
+        keys.append(posting.mask((title == "") | (company == ""), ""))
+    if "job_url_direct" in jobs.columns:
+        urls = _normalize_url(jobs["job_url_direct"])
+        if "site" in jobs.columns:
+            sites = jobs["site"].fillna("").astype(str)
+            own_board = [
+                bool(url) and _is_own_board_url(site, url)
+                for site, url in zip(sites.tolist(), urls.tolist())
+            ]
+            urls = urls.mask(own_board, "")
+        keys.append(urls)
+    return keys
+
+
+def _column(jobs: pd.DataFrame, name: str) -> list[str]:
+    if name not in jobs.columns:
+        return [""] * len(jobs)
+    return jobs[name].fillna("").astype(str).tolist()
+
+
+def duplicate_groups(jobs: pd.DataFrame) -> pd.Series:
+    """
+    Links the rows describing the same posting, typically found on several boards.
+    Rows are duplicates when they share the normalized title, company and city, or
+    the direct job url (with its identifying query parameters, and unless it is a
+    page of the board the row was scraped from). Rows of one site with distinct ids
+    are distinct postings of that board and never end up in one group. Rows are only
+    compared within the block of their key and linked transitively, so the cost grows
+    linearly with the number of rows.
+    :param jobs: DataFrame as returned by scrape_jobs
+    :return: Series of group numbers aligned with jobs, equal for duplicates
+    """
+    parent = list(range(len(jobs)))
+    # id of the row each group holds per site
+    postings = [
+        {site: job_id} if site and job_id else {}
+        for site, job_id in zip(_column(jobs, "site"), _column(jobs, "id"))
+    ]
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> bool:
+        root, other = find(i), find(j)
+        if root == other:
+            return True
+        ids, other_ids = postings[root], postings[other]
+        if any(ids.get(site, job_id) != job_id for site, job_id in other_ids.items()):
+            return False
+        if len(ids) < len(other_ids):
+            root, other, ids, other_ids = other, root, other_ids, ids
+        ids.update(other_ids)
+        postings[other] = {}
+        parent[other] = root
+        return True
+
+    for key in _blocking_keys(jobs):
+        # rows of a block that could not join the groups of the rows before them
+        heads_of_block: dict[str, list[int]] = {}
+        for i, value in enumerate(key.tolist()):
+            if not value:
+                continue
+            heads = heads_of_block.setdefault(value, [])
+            if not any(union(head, i) for head in heads):
+                heads.append(i)
+
+    groups, _ = pd.factorize(pd.Series([find(i) for i in range(len(jobs))]))
+    return pd.Series(groups, index=jobs.index, name="duplicate_group")
+
+
+def dedupe_jobs(jobs: pd.DataFrame, mode: str = "group") -> pd.DataFrame:
+    """
+    :param jobs: DataFrame as returned by scrape_jobs
+    :param mode: "group" adds a duplicate_group column, "collapse" keeps one row per
+        group, with the missing values of its first row filled in from its duplicates
+    :return: deduplicated DataFrame
+    """
+    if mode not in DEDUPE_MODES:
+        raise ValueError(f"Invalid dedupe mode: {mode}, expected one of {DEDUPE_MODES}")
+    if jobs.empty:
+        return jobs
+    jobs = jobs.assign(duplicate_group=duplicate_groups(jobs))
+    if mode == "group":
+        return jobs
+    return (
+        jobs.groupby("duplicate_group", sort=False)
+        .first()
+        .reset_index()
+        .reindex(columns=jobs.columns)
+    )
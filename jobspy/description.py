@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+
+def content_digest(text: str | bytes) -> str:
+    """
+    :return: hex digest addressing a description by its content
+    """
+    data = text.encode() if isinstance(text, str) else text
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class DescriptionStore:
+    """
+    Content-addressed store of job descriptions.
+    Conversions of raw HTML or parsed tags are memoized by the digest of the HTML, so
+    a posting seen from several searches or boards is converted once and every copy
+    shares one string. Texts put in the store are kept once per digest, letting
+    DataFrames hold the digest as a reference instead of the full text. Both are
+    bounded: a store kept across many scrapes forgets its least recently used texts,
+    and resolving a reference to a forgotten text raises a KeyError rather than
+    quietly returning None.
+    """
+
+    def __init__(self, memo_size: int = 10_000, max_texts: int = 100_000):
+        """
+        :param memo_size: number of conversions remembered, least recently used go first
+        :param max_texts: number of texts kept, least recently used go first; None
+            keeps every text, for refs held longer than max_texts puts
+        """
+        self.memo_size = memo_size
+        self.max_texts = max_texts
+        self.hits = 0
+        self.misses = 0
+        self._memo: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._texts: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def convert(self, html, fmt: str, converter: Callable) -> str:
+        """
+        Converts html with converter unless a conversion of the same html to fmt is
+        memoized
+        :param html: str, bytes or parsed bs4 Tag, a Tag is keyed by its markup
+        :param fmt: name of the output format, part of the memo key
+        """
+        source = html if isinstance(html, (str, bytes)) else str(html)
+        key = (content_digest(source), fmt)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return self._memo[key]
+            self.misses += 1
+        text = converter(html)
+        with self._lock:
+            self._memo[key] = text
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return text
+
+    def put(self, text: str | None) -> str | None:
+        """
+        Stores a text once per content
+        :return: digest referencing the text
+        """
+        if text is None:
+            return None
+        ref = content_digest(text)
+        with self._lock:
+            self._texts.setdefault(ref, text)
+            self._texts.move_to_end(ref)
+            if self.max_texts is not None and len(self._texts) > self.max_texts:
+                self._texts.popitem(last=False)
+        return ref
+
+    def get(self, ref: str | None) -> str | None:
+        """
+        :return: the text referenced by ref
+        :raises KeyError: ref is not in the store, e.g. its text was forgotten to stay
+            within max_texts
+        """
+        if ref is None:
+            return None
+        with self._lock:
+            text = self._texts.get(ref)
+            if text is None:
+                raise KeyError(
+                    f"description {ref} is not in the store, it was never put or was "
+                    f"forgotten to stay within max_texts={self.max_texts}"
+                )
+            self._texts.move_to_end(ref)
+        return text
+
+    def resolve(self, refs):
+        """
+        Resolves references back to texts, e.g. jobs["description"].map(store.get)
+        :param refs: iterable of references
+        :return: list of texts
+        """
+        return [self.get(ref) for ref in refs]
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
+            self._texts.clear()
+
+
+# memoizes the conversions of markdown_converter and plain_converter
+default_store = DescriptionStore()
@@ -42,4 +42,9 @@ class NaukriException(Exception):
 
 class BDJobsException(Exception):
     def __init__(self, message=None):
-        super().__init__(message or "An error occurred with BDJobs")
\ No newline at end of file
+        super().__init__(message or "An error occurred with BDJobs")
+
+class ReplayException(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "No recorded response matches the request")
+
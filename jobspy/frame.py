@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import math
+
+import pandas as pd
+
+from jobspy.description import DescriptionStore
+from jobspy.model import Country, JobPost, SalarySource
+from jobspy.salary import SALARY_COLUMNS, derive_salaries
+from jobspy.util import convert_to_annual, desired_order
+
+
+OUTPUT_FORMATS = ("pandas", "arrow", "polars", "parquet", "ipc")
+
+# pyarrow types of the non-string columns
+ARROW_TYPES = {
+    "date_posted": "date32",
+    "min_amount": "float64",
+    "max_amount": "float64",
+    "is_remote": "bool_",
+    "company_rating": "float64",
+    "company_reviews_count": "int64",
+    "vacancy_count": "int64",
+}
+SORT_KEYS = [("site", "ascending"), ("date_posted", "descending")]
+
+
+def arrow_schema(duplicate_group: bool = False):
+    """
+    :param duplicate_group: append the duplicate_group column of deduplicated jobs
+    :return: pyarrow schema of the desired_order columns
+    """
+    import pyarrow as pa
+
+    fields = [
+        (column, getattr(pa, ARROW_TYPES.get(column, "string"))())
+        for column in desired_order
+    ]
+    if duplicate_group:
+        fields.append(("duplicate_group", pa.int64()))
+    return pa.schema(fields)
+
+
+def write_table(table, output_format: str, output_path: str):
+    """
+    Writes a pyarrow Table to output_path as a Parquet or an Arrow IPC file
+    """
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, output_path)
+    elif output_format == "ipc":
+        import pyarrow as pa
+
+        with pa.OSFile(output_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+def job_to_row(
+    site: str,
+    job: JobPost,
+    enforce_annual_salary: bool = False,
+) -> dict:
+    """
+    Flattens a JobPost into a single output row keyed by the desired_order columns.
+    Salaries are only taken from the job's compensation, JobColumns parses the
+    descriptions of a whole batch at once.
+    :param site: site value the job was scraped from
+    :param job: scraped job
+    :param enforce_annual_salary: converts wages to annual salary
+    :return: dict row
+    """
+    row = {column: getattr(job, column, None) for column in desired_order}
+    row["site"] = site
+    row["company"] = job.company_name
+    row["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job.job_type)
+        if job.job_type
+        else None
+    )
+    row["emails"] = ", ".join(job.emails) if job.emails else None
+    row["location"] = (
+        job.location.display_location() if job.location is not None else None
+    )
+
+    compensation = job.compensation
+    if compensation is not None:
+        row["interval"] = compensation.interval.value if compensation.interval else None
+        row["min_amount"] = compensation.min_amount
+        row["max_amount"] = compensation.max_amount
+        row["currency"] = compensation.currency
+        row["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            row["interval"]
+            and row["interval"] != "yearly"
+            and row["min_amount"]
+            and row["max_amount"]
+        ):
+            convert_to_annual(row)
+
+    if not row["min_amount"]:
+        row["salary_source"] = None
+
+    row["skills"] = ", ".join(job.skills) if job.skills else None
+    return row
+
+
+def _is_na(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class JobColumns:
+    """
+    Collects job rows into per-column lists so the output frame is built once.
+    With a description_store, the description column holds references to the texts
+    kept in the store instead of the texts themselves.
+    """
+
+    def __init__(
+        self,
+        country: Country | None = None,
+        enforce_annual_salary: bool = False,
+        description_store: DescriptionStore | None = None,
+    ):
+        self.country = country
+        self.enforce_annual_salary = enforce_annual_salary
+        self.description_store = description_store
+        self.columns: dict[str, list] = {column: [] for column in desired_order}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append_row(self, row: dict):
+        for column, values in self.columns.items():
+            values.append(row.get(column))
+        self.size += 1
+
+    def add_jobs(self, site: str, jobs: list[JobPost]):
+        rows = [job_to_row(site, job, self.enforce_annual_salary) for job in jobs]
+        if self.country == Country.USA:
+            self._derive_salaries(
+                [row for row, job in zip(rows, jobs) if job.compensation is None]
+            )
+        for row in rows:
+            if self.description_store is not None:
+                row["description"] = self.description_store.put(row["description"])
+            self.append_row(row)
+
+    def _derive_salaries(self, rows: list[dict]):
+        """
+        Parses the salaries of rows without compensation from their descriptions,
+        in one vectorized pass over the batch
+        """
+        if not rows:
+            return
+        frame = pd.DataFrame(rows, columns=SALARY_COLUMNS + ["description"])
+        derived = derive_salaries(frame, self.enforce_annual_salary)
+        for row, values in zip(rows, derived[SALARY_COLUMNS].itertuples(index=False)):
+            for column, value in zip(SALARY_COLUMNS, values):
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                row[column] = None if _is_na(value) else value
+
+    def to_arrow(self):
+        """
+        Builds a pyarrow Table straight from the column lists, typed by arrow_schema,
+        without a pandas intermediate
+        """
+        import pyarrow as pa
+
+        schema = arrow_schema()
+        arrays = []
+        for field in schema:
+            values = self.columns[field.name]
+            if pa.types.is_string(field.type):
+                values = [None if _is_na(value) else str(value) for value in values]
+            elif pa.types.is_floating(field.type) or pa.types.is_integer(field.type):
+                values = [None if _is_na(value) else value for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Builds the DataFrame in desired_order. Missing values are NaN in columns that
+        have data and None in columns that are entirely empty, matching the result of
+        concatenating one-row frames with their all-NA columns dropped.
+        """
+        data = {}
+        for column, values in self.columns.items():
+            missing = [_is_na(value) for value in values]
+            if all(missing):
+                data[column] = pd.Series([None] * self.size, dtype=object)
+            elif any(missing):
+                data[column] = pd.Series(
+                    [math.nan if na else value for value, na in zip(values, missing)]
+                )
+            else:
+                data[column] = pd.Series(values)
+        return pd.DataFrame(data, columns=desired_order)
@@ -5,20 +5,21 @@ import json
 import requests
 from typing import Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
     get_cursor_for_page,
+    job_listing_id,
     parse_compensation,
     parse_location,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    text_features,
     create_logger,
     create_session,
     markdown_converter,
 )
+from jobspy import stats, tracing
 from jobspy.exception import GlassdoorException
 from jobspy.model import (
     JobPost,
@@ -34,13 +35,19 @@ log = create_logger("Glassdoor")
 
 class Glassdoor(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes GlassdoorScraper with the Glassdoor job search url
         """
         site = Site(Site.GLASSDOOR)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        super().__init__(
+            site, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent, **kwargs
+        )
 
         self.base_url = None
         self.country = None
@@ -61,7 +68,10 @@ class Glassdoor(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            **self.session_options,
         )
         token = self._get_csrf_token()
         headers["gd-csrf-token"] = token if token else fallback_token
@@ -82,12 +92,15 @@ class Glassdoor(Scraper):
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
+            if self.stopped:
+                break
             log.info(f"search page: {page} / {range_end - 1}")
             try:
                 jobs, cursor = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
                 job_list.extend(jobs)
+                self.emit_jobs(job_list)
                 if not jobs or len(job_list) >= scraper_input.results_wanted:
                     job_list = job_list[: scraper_input.results_wanted]
                     break
@@ -96,6 +109,7 @@ class Glassdoor(Scraper):
                 break
         return JobResponse(jobs=job_list)
 
+    @tracing.traced
     def _fetch_jobs_page(
         self,
         scraper_input: ScraperInput,
@@ -115,6 +129,7 @@ class Glassdoor(Scraper):
                 f"{self.base_url}/graph",
                 timeout_seconds=15,
                 data=payload,
+                kind="search",
             )
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
@@ -132,18 +147,21 @@ class Glassdoor(Scraper):
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        # known jobs are dropped before their descriptions are fetched, a page of
+        # only known jobs comes back empty and ends the search
+        known = self.known_ids([f"gd-{job_listing_id(job)}" for job in jobs_data])
+        jobs_data = [
+            job for job in jobs_data if f"gd-{job_listing_id(job)}" not in known
+        ]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        futures = [self.scheduler.submit(self._process_job, job) for job in jobs_data]
+        for future in futures:
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
         return jobs, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
@@ -165,9 +183,10 @@ class Glassdoor(Scraper):
         """
         Processes a single job and fetches its description.
         """
-        job_id = job_data["jobview"]["job"]["listingId"]
+        job_id = job_listing_id(job_data)
         job_url = f"{self.base_url}job-listing/j?jl={job_id}"
         if job_url in self.seen_urls:
+            stats.count("duplicates_dropped")
             return None
         self.seen_urls.add(job_url)
         job = job_data["jobview"]
@@ -201,7 +220,7 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
+        return JobPost.create(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -212,11 +231,12 @@ class Glassdoor(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=list(text_features(description).emails) if description else None,
             company_logo=company_logo,
             listing_type=listing_type,
         )
 
+    @tracing.traced
     def _fetch_job_description(self, job_id):
         """
         Fetches the job description for a single job ID.
@@ -246,7 +266,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, kind="detail")
         if res.status_code != 200:
             return None
         data = res.json()[0]
@@ -1,4 +1,5 @@
 from jobspy.model import Compensation, CompensationInterval, Location, JobType
+from jobspy.util import get_enum_from_job_type
 
 
 def parse_compensation(data: dict) -> Compensation | None:
@@ -15,7 +16,7 @@ def parse_compensation(data: dict) -> Compensation | None:
         interval = CompensationInterval.get_interval(pay_period)
     min_amount = int(adjusted_pay.get("p10") // 1)
     max_amount = int(adjusted_pay.get("p90") // 1)
-    return Compensation(
+    return Compensation.create(
         interval=interval,
         min_amount=min_amount,
         max_amount=max_amount,
@@ -24,19 +25,22 @@ def parse_compensation(data: dict) -> Compensation | None:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
+    job_type = get_enum_from_job_type(job_type_str)
+    return [job_type] if job_type else None
 
 
 def parse_location(location_name: str) -> Location | None:
     if not location_name or location_name == "Remote":
         return
     city, _, state = location_name.partition(", ")
-    return Location(city=city, state=state)
+    return Location.create(city=city, state=state)
 
 
 def get_cursor_for_page(pagination_cursors, page_num):
     for cursor_data in pagination_cursors:
         if cursor_data["pageNumber"] == page_num:
             return cursor_data["cursor"]
+
+
+def job_listing_id(job_data: dict):
+    return job_data["jobview"]["job"]["listingId"]
@@ -7,6 +7,7 @@ from typing import Tuple
 from datetime import datetime, timedelta
 
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
+from jobspy import stats, tracing
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -16,19 +17,23 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.util import extract_job_type, create_session, text_features
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
 class Google(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes Google Scraper with the Goodle jobs search url
         """
         site = Site(Site.GOOGLE)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert, **kwargs)
 
         self.country = None
         self.session = None
@@ -48,9 +53,14 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            **self.session_options,
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        self.emit_jobs(job_list, start=scraper_input.offset)
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
@@ -62,6 +72,7 @@ class Google(Scraper):
         while (
             len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
             and forward_cursor
+            and not self.stopped
         ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
@@ -75,6 +86,7 @@ class Google(Scraper):
                 log.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
+            self.emit_jobs(job_list, start=scraper_input.offset)
             page += 1
         return JobResponse(
             jobs=job_list[
@@ -83,6 +95,7 @@ class Google(Scraper):
             ]
         )
 
+    @tracing.traced
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
         query = f"{self.scraper_input.search_term} jobs"
@@ -121,7 +134,9 @@ class Google(Scraper):
             query = self.scraper_input.google_search_term
 
         params = {"q": query, "udm": "8"}
-        response = self.session.get(self.url, headers=headers_initial, params=params)
+        response = self.session.get(
+            self.url, headers=headers_initial, params=params, kind="search"
+        )
 
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
@@ -134,9 +149,12 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
+    @tracing.traced
     def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
-        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
+        response = self.session.get(
+            self.jobs_url, headers=headers_jobs, params=params, kind="search"
+        )
         return self._parse_jobs(response.text)
 
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
@@ -167,6 +185,9 @@ class Google(Scraper):
     def _parse_job(self, job_info: list):
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
         if job_url in self.seen_urls:
+            stats.count("duplicates_dropped")
+            return
+        if self.known_ids([f"go-{job_info[28]}"]):
             return
         self.seen_urls.add(job_url)
 
@@ -184,19 +205,20 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        features = text_features(description)
 
-        job_post = JobPost(
+        job_post = JobPost.create(
             id=f"go-{job_info[28]}",
             title=title,
             company_name=company_name,
-            location=Location(
+            location=Location.create(
                 city=city, state=state, country=country[0] if country else None
             ),
             job_url=job_url,
             date_posted=date_posted,
             is_remote="remote" in description.lower() or "wfh" in description.lower(),
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            emails=list(features.emails) if description else None,
+            job_type=extract_job_type(description, features),
         )
         return job_post
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable
+from urllib.parse import urlsplit
+
+from jobspy import stats
+
+
+class HostLatency:
+    """
+    Recent detail request latencies of one host and the hedges sent for them
+    """
+
+    def __init__(self, window: int):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.threshold: float | None = None
+        self.stale = 0  # samples added since the threshold was computed
+        self.requests = 0
+        self.hedges = 0
+
+
+class HedgePolicy:
+    """
+    Hedges detail page requests: when a request is still pending after the given
+    latency percentile of its host, a duplicate is sent through another proxy (or
+    another connection without proxies) and whichever response comes first is used.
+    Both requests run on the scheduler's fetch pool, each taking its own rate token
+    and request slot. Hedges are capped at max_ratio of the host's detail requests, so a slow host
+    costs at most that many extra requests. Pass an instance to scrape_jobs to
+    enable it, the hedges sent and won show in the run's ScrapeStats.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_ratio: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+    ):
+        """
+        :param percentile: latency percentile after which a request is hedged
+        :param max_ratio: most hedges per detail request of a host
+        :param min_samples: latencies of a host observed before it is hedged
+        :param window: recent latencies the percentile is computed over
+        :param min_delay: shortest wait before hedging, in seconds
+        """
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self._hosts: dict[str, HostLatency] = {}
+        self._lock = threading.Lock()
+
+    def send(self, url: str, send, submit: Callable[..., Future] | None = None):
+        """
+        Performs a request, hedging it once it is slower than the host's threshold
+        :param send: callable performing the request, called with hedge=True for the
+            duplicate
+        :param submit: runs a callable on the fetch pool, e.g. Scheduler.submit,
+            requests are not hedged without it
+        :return: response
+        """
+        host = self._host(url)
+        with self._lock:
+            host.requests += 1
+            threshold = host.threshold
+        if threshold is None or submit is None:
+            return self._timed(host, send)
+
+        start = time.perf_counter()
+        primary = submit(send)
+        if not wait([primary], timeout=threshold).done and primary.cancel():
+            # the pool is saturated and the request never started, sending it from
+            # here keeps callers running on the pool from waiting on each other
+            return self._timed(host, send)
+        primary.add_done_callback(
+            lambda _: self._observe(host, time.perf_counter() - start)
+        )
+        if primary.done() or not self._spend(host):
+            return primary.result()
+
+        stats.count("hedges")
+        hedged = submit(send, hedge=True)
+        pending = {primary, hedged}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # prefer a response over an error while the other request may succeed
+            for future in done:
+                if future.exception() is None:
+                    if future is hedged:
+                        stats.count("hedge_wins")
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+            if not pending:
+                return primary.result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                name: {
+                    "requests": host.requests,
+                    "hedges": host.hedges,
+                    "threshold": host.threshold,
+                }
+                for name, host in self._hosts.items()
+            }
+
+    def _host(self, url: str) -> HostLatency:
+        name = urlsplit(url).hostname or ""
+        with self._lock:
+            if name not in self._hosts:
+                self._hosts[name] = HostLatency(self.window)
+            return self._hosts[name]
+
+    def _timed(self, host: HostLatency, send):
+        start = time.perf_counter()
+        response = send()
+        self._observe(host, time.perf_counter() - start)
+        return response
+
+    def _spend(self, host: HostLatency) -> bool:
+        with self._lock:
+            if host.hedges >= host.requests * self.max_ratio:
+                return False
+            host.hedges += 1
+            return True
+
+    def _observe(self, host: HostLatency, latency: float):
+        with self._lock:
+            host.samples.append(latency)
+            host.stale += 1
+            # sorting the window on every sample would cost more than it's worth
+            if len(host.samples) < self.min_samples or (
+                host.threshold is not None and host.stale < 10
+            ):
+                return
+            ordered = sorted(host.samples)
+            index = min(int(len(ordered) * self.percentile), len(ordered) - 1)
+            host.threshold = max(ordered[index], self.min_delay)
+            host.stale = 0
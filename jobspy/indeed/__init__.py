@@ -6,6 +6,7 @@ from typing import Tuple
 
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
+from jobspy import stats, tracing
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -17,8 +18,8 @@ from jobspy.model import (
     DescriptionFormat,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     markdown_converter,
+    text_features,
     create_session,
     create_logger,
 )
@@ -28,15 +29,23 @@ log = create_logger("Indeed")
 
 class Indeed(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, **kwargs)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies,
+            ca_cert=ca_cert,
+            is_tls=False,
+            has_retry=True,
+            **self.session_options,
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -63,7 +72,10 @@ class Indeed(Scraper):
 
         cursor = None
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while (
+            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
+            and not self.stopped
+        ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
@@ -72,6 +84,7 @@ class Indeed(Scraper):
                 log.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
+            self.emit_jobs(job_list, start=scraper_input.offset)
             page += 1
         return JobResponse(
             jobs=job_list[
@@ -80,6 +93,7 @@ class Indeed(Scraper):
             ]
         )
 
+    @tracing.traced
     def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
@@ -115,6 +129,7 @@ class Indeed(Scraper):
             headers=api_headers_temp,
             json=payload,
             timeout=10,
+            kind="search",
             verify=False,
         )
         if not response.ok:
@@ -125,9 +140,13 @@ class Indeed(Scraper):
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+        # a page of only known jobs comes back empty and ends the search
+        known = self.known_ids([f'in-{job["job"]["key"]}' for job in jobs])
 
         job_list = []
         for job in jobs:
+            if f'in-{job["job"]["key"]}' in known:
+                continue
             processed_job = self._process_job(job["job"])
             if processed_job:
                 job_list.append(processed_job)
@@ -200,11 +219,13 @@ class Indeed(Scraper):
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
         if job_url in self.seen_urls:
+            stats.count("duplicates_dropped")
             return
         self.seen_urls.add(job_url)
         description = job["description"]["html"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
+        features = text_features(description)
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
@@ -212,7 +233,7 @@ class Indeed(Scraper):
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        return JobPost.create(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
@@ -221,7 +242,7 @@ class Indeed(Scraper):
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
-            location=Location(
+            location=Location.create(
                 city=job.get("location", {}).get("city"),
                 state=job.get("location", {}).get("admin1Code"),
                 country=job.get("location", {}).get("countryCode"),
@@ -233,8 +254,8 @@ class Indeed(Scraper):
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=is_job_remote(job, description),
+            emails=list(features.emails) if description else None,
+            is_remote=is_job_remote(job, features),
             company_addresses=(
                 employer_details["addresses"][0]
                 if employer_details.get("addresses")
@@ -1,5 +1,5 @@
 from jobspy.model import CompensationInterval, JobType, Compensation
-from jobspy.util import get_enum_from_job_type
+from jobspy.util import TextFeatures, get_enum_from_job_type, text_features
 
 
 def get_job_type(attributes: list) -> list[JobType]:
@@ -37,7 +37,7 @@ def get_compensation(compensation: dict) -> Compensation | None:
         return None
     min_range = comp["range"].get("min")
     max_range = comp["range"].get("max")
-    return Compensation(
+    return Compensation.create(
         interval=interval,
         min_amount=int(min_range) if min_range is not None else None,
         max_amount=int(max_range) if max_range is not None else None,
@@ -49,22 +49,18 @@ def get_compensation(compensation: dict) -> Compensation | None:
     )
 
 
-def is_job_remote(job: dict, description: str) -> bool:
+def is_job_remote(job: dict, features: TextFeatures) -> bool:
     """
     Searches the description, location, and attributes to check if job is remote
+    :param features: text_features of the description
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
     is_remote_in_attributes = any(
-        any(keyword in attr["label"].lower() for keyword in remote_keywords)
-        for attr in job["attributes"]
-    )
-    is_remote_in_description = any(
-        keyword in description.lower() for keyword in remote_keywords
-    )
-    is_remote_in_location = any(
-        keyword in job["location"]["formatted"]["long"].lower()
-        for keyword in remote_keywords
+        text_features(attr["label"]).is_remote for attr in job["attributes"]
     )
+    is_remote_in_description = features.is_remote
+    is_remote_in_location = text_features(
+        job["location"]["formatted"]["long"]
+    ).is_remote
     return is_remote_in_attributes or is_remote_in_description or is_remote_in_location
 
 
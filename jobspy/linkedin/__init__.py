@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+from jobspy import stats, tracing
 from jobspy.exception import LinkedInException
 from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
@@ -32,13 +31,14 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    text_features,
     currency_parser,
     markdown_converter,
     plain_converter,
     create_session,
     remove_attributes,
     create_logger,
+    parse_response,
 )
 
 log = create_logger("LinkedIn")
@@ -46,24 +46,28 @@ log = create_logger("LinkedIn")
 
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
+    rate_limit = 0.2  # initial search page requests per second, adapted to responses
     jobs_per_page = 25
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes LinkedInScraper with the LinkedIn job search url
         """
-        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
             has_retry=True,
-            delay=5,
             clear_cookies=True,
+            rate_limit=self.rate_limit,
+            **self.session_options,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -85,7 +89,9 @@ class LinkedIn(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not self.stopped
         )
         while continue_search():
             request_count += 1
@@ -115,11 +121,15 @@ class LinkedIn(Scraper):
                 params["f_TPR"] = f"r{seconds_old}"
 
             params = {k: v for k, v in params.items() if v is not None}
+            # detail pages go through the proxy that fetched their search page
+            affinity = (id(self), start)
             try:
                 response = self.session.get(
                     f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
                     params=params,
                     timeout=10,
+                    kind="search",
+                    affinity=affinity,
                 )
                 if response.status_code not in range(200, 400):
                     if response.status_code == 429:
@@ -138,40 +148,57 @@ class LinkedIn(Scraper):
                     log.error(f"LinkedIn: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_response(
+                response, parse_only=SoupStrainer("div", class_=_is_search_card)
+            )
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
 
+            page_cards = []
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
                     href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
-
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+                    page_cards.append((job_card, href.split("-")[-1]))
+            page_ids = [f"li-{job_id}" for _, job_id in page_cards]
+            known = self.known_ids(page_ids)
+            if page_ids and known.issuperset(page_ids):
+                log.info("search page holds only known jobs, stopping")
+                break
+
+            new_cards = []
+            for job_card, job_id in page_cards:
+                if len(job_list) + len(new_cards) >= scraper_input.results_wanted:
+                    break
+                if job_id in seen_ids:
+                    stats.count("duplicates_dropped")
+                    continue
+                if f"li-{job_id}" in known:
+                    continue
+                seen_ids.add(job_id)
+                new_cards.append((job_card, job_id))
+
+            # job details are fetched concurrently, results keep the card order
+            fetch_desc = scraper_input.linkedin_fetch_description
+            try:
+                job_posts = self.scheduler.map(
+                    lambda card: self._process_job(*card, fetch_desc, affinity),
+                    new_cards,
+                )
+            except Exception as e:
+                raise LinkedInException(str(e))
+            job_list.extend(job_post for job_post in job_posts if job_post)
 
+            self.emit_jobs(job_list)
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
     def _process_job(
-        self, job_card: Tag, job_id: str, full_descr: bool
+        self, job_card: Tag, job_id: str, full_descr: bool, affinity=None
     ) -> Optional[JobPost]:
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
@@ -183,7 +210,7 @@ class LinkedIn(Scraper):
             salary_max = salary_values[1]
             currency = salary_text[0] if salary_text[0] != "$" else "USD"
 
-            compensation = Compensation(
+            compensation = Compensation.create(
                 min_amount=int(salary_min),
                 max_amount=int(salary_max),
                 currency=currency,
@@ -218,11 +245,12 @@ class LinkedIn(Scraper):
                 date_posted = None
         job_details = {}
         if full_descr:
-            job_details = self._get_job_details(job_id)
+            job_details = self._get_job_details(job_id, affinity)
             description = job_details.get("description")
-        is_remote = is_job_remote(title, description, location)
+        features = text_features(description)
+        is_remote = is_job_remote(title, features, location)
 
-        return JobPost(
+        return JobPost.create(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -237,20 +265,25 @@ class LinkedIn(Scraper):
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(description),
+            emails=list(features.emails) if description else None,
             company_logo=job_details.get("company_logo"),
             job_function=job_details.get("job_function"),
         )
 
-    def _get_job_details(self, job_id: str) -> dict:
+    @tracing.traced
+    def _get_job_details(self, job_id: str, affinity=None) -> dict:
         """
         Retrieves job description and other job details by going to the job page url
         :param job_page_url:
+        :param affinity: proxy affinity key of the job's search page
         :return: dict
         """
         try:
             response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
+                f"{self.base_url}/jobs/view/{job_id}",
+                timeout=5,
+                kind="detail",
+                affinity=affinity,
             )
             response.raise_for_status()
         except:
@@ -258,18 +291,19 @@ class LinkedIn(Scraper):
         if "linkedin.com/signup" in response.url:
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = parse_response(response)
         div_content = soup.find(
             "div", class_=lambda x: x and "show-more-less-html__markup" in x
         )
         description = None
         if div_content is not None:
-            div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
+                description = markdown_converter(div_content)
             elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
-                description = plain_converter(description)
+                description = plain_converter(div_content)
+            else:
+                div_content = remove_attributes(div_content)
+                description = div_content.prettify(formatter="html")
         h3_tag = soup.find(
             "h3", text=lambda text: text and "Job function" in text.strip()
         )
@@ -303,7 +337,7 @@ class LinkedIn(Scraper):
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
+        location = Location.create(country=Country.from_string(self.country))
         if metadata_card is not None:
             location_tag = metadata_card.find(
                 "span", class_="job-search-card__location"
@@ -312,7 +346,7 @@ class LinkedIn(Scraper):
             parts = location_string.split(", ")
             if len(parts) == 2:
                 city, state = parts
-                location = Location(
+                location = Location.create(
                     city=city,
                     state=state,
                     country=Country.from_string(self.country),
@@ -320,7 +354,7 @@ class LinkedIn(Scraper):
             elif len(parts) == 3:
                 city, state, country = parts
                 country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
+                location = Location.create(city=city, state=state, country=country)
         return location
 
     def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
@@ -339,3 +373,15 @@ class LinkedIn(Scraper):
                 job_url_direct = unquote(job_url_direct_match.group())
 
         return job_url_direct
+
+
+def _is_search_card(classes: str | list[str] | None) -> bool:
+    """
+    Matches the class attribute of a search card by token, cards carry several
+    classes and the strainer sees the raw attribute before it is split
+    """
+    if classes is None:
+        return False
+    if isinstance(classes, str):
+        classes = classes.split()
+    return "base-search-card" in classes
@@ -1,7 +1,7 @@
 from bs4 import BeautifulSoup
 
 from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
+from jobspy.util import TextFeatures, get_enum_from_job_type, text_features
 
 
 def job_type_code(job_type_enum: JobType) -> str:
@@ -85,12 +85,12 @@ def parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
     return industry
 
 
-def is_job_remote(title: dict, description: str, location: Location) -> bool:
+def is_job_remote(title: dict, features: TextFeatures, location: Location) -> bool:
     """
     Searches the title, location, and description to check if job is remote
+    :param features: text_features of the description
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
     location = location.display_location()
-    full_string = f'{title} {description} {location}'.lower()
-    is_remote = any(keyword in full_string for keyword in remote_keywords)
-    return is_remote
+    return features.is_remote or any(
+        text_features(text).is_remote for text in (title, location)
+    )
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import importlib
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
-from datetime import date
+from typing import Callable, Optional
+from datetime import date, datetime
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy import stats
+from jobspy.cache import HttpCache
+from jobspy.hedge import HedgePolicy
+from jobspy.pool import SessionPool
+from jobspy.replay import HttpArchive
+from jobspy.retry import RetryPolicy
+from jobspy.scheduler import Scheduler
+from jobspy.seen import SeenStore
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -168,17 +180,60 @@ class Country(Enum):
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        country = _COUNTRY_INDEX.get(country_str)
+        if country is not None:
+            return country
         valid_countries = [country.value for country in cls]
         raise ValueError(
             f"Invalid country string: '{country_str}'. Valid countries are: {', '.join([country[0] for country in valid_countries])}"
         )
 
 
-class Location(BaseModel):
+# the first country listing a name wins, as with the former linear scan
+_COUNTRY_INDEX = {
+    name: country
+    for country in reversed(Country)
+    for name in country.value[0].split(",")
+}
+
+_strict_validation = os.environ.get("JOBSPY_STRICT_VALIDATION", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+def set_strict_validation(strict: bool = True):
+    """
+    Sets whether the scrapers validate every JobPost, Location and Compensation they
+    build with pydantic. Off unless the JOBSPY_STRICT_VALIDATION environment variable
+    is set, the models are then constructed from the parsed data directly.
+    :param strict: validate the models on construction
+    """
+    global _strict_validation
+    _strict_validation = strict
+
+
+class TrustedModel(BaseModel):
+    """
+    Model built by the scrapers from data they parsed themselves. create() skips the
+    pydantic validation unless strict validation is set, applying only the
+    conversions the scrapers rely on.
+    """
+
+    @classmethod
+    def create(cls, **data):
+        with stats.stage("model"):
+            if _strict_validation:
+                return cls(**data)
+            return cls.model_construct(**cls._normalize(data))
+
+    @classmethod
+    def _normalize(cls, data: dict) -> dict:
+        return data
+
+
+class Location(TrustedModel):
     country: Country | str | None = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -214,29 +269,40 @@ class CompensationInterval(Enum):
 
     @classmethod
     def get_interval(cls, pay_period):
-        interval_mapping = {
-            "YEAR": cls.YEARLY,
-            "HOUR": cls.HOURLY,
-        }
-        if pay_period in interval_mapping:
-            return interval_mapping[pay_period].value
-        else:
-            return cls[pay_period].value if pay_period in cls.__members__ else None
+        interval = _INTERVAL_INDEX.get(pay_period)
+        return interval.value if interval else None
+
 
+_INTERVAL_INDEX = {
+    "YEAR": CompensationInterval.YEARLY,
+    "HOUR": CompensationInterval.HOURLY,
+    **CompensationInterval.__members__,
+}
 
-class Compensation(BaseModel):
+
+class Compensation(TrustedModel):
     interval: Optional[CompensationInterval] = None
     min_amount: float | None = None
     max_amount: float | None = None
     currency: Optional[str] = "USD"
 
+    @classmethod
+    def _normalize(cls, data: dict) -> dict:
+        if isinstance(data.get("interval"), str):
+            data["interval"] = CompensationInterval(data["interval"])
+        # validation would coerce the ints boards return, keeping the columns float
+        for field in ("min_amount", "max_amount"):
+            if data.get(field) is not None:
+                data[field] = float(data[field])
+        return data
+
 
 class DescriptionFormat(Enum):
     MARKDOWN = "markdown"
     HTML = "html"
     PLAIN = "plain"
 
-class JobPost(BaseModel):
+class JobPost(TrustedModel):
     id: str | None = None
     title: str
     company_name: str | None
@@ -280,6 +346,19 @@ class JobPost(BaseModel):
     vacancy_count: int | None = None  #from vacancy
     work_from_home_type: str | None = None  #from clusters.wfhType (e.g., "Hybrid", "Remote")
 
+    @classmethod
+    def _normalize(cls, data: dict) -> dict:
+        date_posted = data.get("date_posted")
+        if isinstance(date_posted, datetime):
+            data["date_posted"] = date_posted.date()
+        elif isinstance(date_posted, str):
+            data["date_posted"] = date.fromisoformat(date_posted)
+        if data.get("job_type"):
+            data["job_type"] = [job_type for job_type in data["job_type"] if job_type]
+        if data.get("company_rating") is not None:
+            data["company_rating"] = float(data["company_rating"])
+        return data
+
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
 
@@ -294,6 +373,28 @@ class Site(Enum):
     NAUKRI = "naukri"
     BDJOBS = "bdjobs"  # Add this line
 
+    @property
+    def scraper_class(self) -> type[Scraper]:
+        """
+        Imports the site's scraper on first use, so only the scrapers (and their
+        dependencies) of the sites actually scraped get loaded
+        """
+        module_name, class_name = SCRAPER_CLASSES[self.value]
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+# site value -> (module, class) of its scraper
+SCRAPER_CLASSES = {
+    "linkedin": ("jobspy.linkedin", "LinkedIn"),
+    "indeed": ("jobspy.indeed", "Indeed"),
+    "zip_recruiter": ("jobspy.ziprecruiter", "ZipRecruiter"),
+    "glassdoor": ("jobspy.glassdoor", "Glassdoor"),
+    "google": ("jobspy.google", "Google"),
+    "bayt": ("jobspy.bayt", "BaytScraper"),
+    "naukri": ("jobspy.naukri", "Naukri"),
+    "bdjobs": ("jobspy.bdjobs", "BDJobs"),
+}
+
 
 class SalarySource(Enum):
     DIRECT_DATA = "direct_data"
@@ -324,12 +425,82 @@ class ScraperInput(BaseModel):
 
 class Scraper(ABC):
     def __init__(
-        self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        site: Site,
+        proxies: list[str] | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        scheduler: Scheduler | None = None,
+        cache: HttpCache | None = None,
+        seen: SeenStore | None = None,
+        archive: HttpArchive | None = None,
+        session_pool: SessionPool | None = None,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.scheduler = scheduler or Scheduler.default()
+        # extra create_session kwargs shared by every session of the scraper
+        self.session_options = {
+            "scheduler": self.scheduler,
+            "cache": cache,
+            "archive": archive,
+            "retry": retry,
+            "hedge": hedge,
+            "pool": session_pool,
+            "pool_scope": site.value,
+        }
+        self.seen = seen
+        self.on_jobs: Callable[[list[JobPost]], None] | None = None
+        self.jobs_emitted = 0
+        self.stop_event: threading.Event | None = None
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def close(self):
+        """
+        Hands the scraper's session back to its pool once it is done scraping
+        """
+        release = getattr(getattr(self, "session", None), "release", None)
+        if release is not None:
+            release()
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Whether the caller stopped consuming the scrape, scrapers check it between
+        pages and return the jobs they have
+        """
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def known_ids(self, job_ids: list[str]) -> set[str]:
+        """
+        In incremental mode, returns the ids of job_ids that previous runs returned, so
+        scrapers skip them before fetching any detail page and stop paging once a
+        page holds nothing new
+        :param job_ids: JobPost ids found on a page
+        """
+        if self.seen is None or not job_ids:
+            return set()
+        known = self.seen.known(job_ids)
+        stats.count("known_skipped", len(known))
+        return known
+
+    def emit_jobs(self, job_list: list[JobPost], start: int = 0):
+        """
+        Hands the jobs of job_list[start:start + results_wanted] that were not handed
+        out yet to the on_jobs callback, so callers can stream results page by page
+        :param job_list: all jobs scraped so far
+        :param start: index of the first job that will be returned by scrape
+        """
+        if self.on_jobs is None or self.stopped:
+            return
+        stop = start + self.scraper_input.results_wanted
+        batch = job_list[start + self.jobs_emitted : stop]
+        if batch:
+            self.jobs_emitted += len(batch)
+            self.on_jobs(batch)
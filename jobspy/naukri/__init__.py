@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
 from typing import Optional
 
 import regex as re
 import requests
 
+from jobspy import stats
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
@@ -28,35 +27,40 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    TextFeatures,
     currency_parser,
     markdown_converter,
     create_session,
     create_logger,
+    text_features,
 )
 
 log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
+    rate_limit = 0.2  # initial search page requests per second, adapted to responses
     jobs_per_page = 20  
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
         """
-        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
             has_retry=True,
-            delay=5,
             clear_cookies=True,
+            rate_limit=self.rate_limit,
+            **self.session_options,
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
@@ -79,7 +83,9 @@ class Naukri(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: len(job_list) < scraper_input.results_wanted
+            and page <= 50  # Arbitrary limit
+            and not self.stopped
         )
 
         while continue_search():
@@ -107,7 +113,9 @@ class Naukri(Scraper):
             params = {k: v for k, v in params.items() if v is not None}
             try:
                 log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
+                response = self.session.get(
+                    self.base_url, params=params, timeout=10, kind="search"
+                )
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
@@ -122,9 +130,18 @@ class Naukri(Scraper):
                 log.error(f"Naukri API request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
 
+            page_ids = [f"nk-{job['jobId']}" for job in job_details if job.get("jobId")]
+            known = self.known_ids(page_ids)
+            if page_ids and known.issuperset(page_ids):
+                log.info("Page holds only known jobs, stopping")
+                break
+
             for job in job_details:
                 job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
+                if not job_id or f"nk-{job_id}" in known:
+                    continue
+                if job_id in seen_ids:
+                    stats.count("duplicates_dropped")
                     continue
                 seen_ids.add(job_id)
                 log.debug(f"Processing job ID: {job_id}")
@@ -141,8 +158,8 @@ class Naukri(Scraper):
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
 
+            self.emit_jobs(job_list)
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
@@ -173,7 +190,8 @@ class Naukri(Scraper):
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
 
-        is_remote = is_job_remote(title, description or "", location)
+        features = text_features(description)
+        is_remote = is_job_remote(title, features, location)
         company_logo = job.get("logoPathV3") or job.get("logoPath")
 
         # Naukri-specific fields
@@ -183,9 +201,9 @@ class Naukri(Scraper):
         company_rating = float(ambition_box.get("AggregateRating")) if ambition_box.get("AggregateRating") else None
         company_reviews_count = ambition_box.get("ReviewsCount")
         vacancy_count = job.get("vacancy")
-        work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
+        work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, features)
 
-        job_post = JobPost(
+        job_post = JobPost.create(
             id=f"nk-{job_id}",
             title=title,
             company_name=company,
@@ -198,7 +216,7 @@ class Naukri(Scraper):
             job_type=job_type,
             company_industry=company_industry,
             description=description,
-            emails=extract_emails_from_text(description or ""),
+            emails=list(features.emails) if description else None,
             company_logo=company_logo,
             skills=skills,
             experience_range=experience_range,
@@ -214,14 +232,14 @@ class Naukri(Scraper):
         """
         Extracts location data from placeholders
         """
-        location = Location(country=Country.INDIA)
+        location = Location.create(country=Country.INDIA)
         for placeholder in placeholders:
             if placeholder.get("type") == "location":
                 location_str = placeholder.get("label", "")
                 parts = location_str.split(", ")
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
-                location = Location(city=city, state=state, country=Country.INDIA)
+                location = Location.create(city=city, state=state, country=Country.INDIA)
                 log.debug(f"Parsed location: {location.display_location()}")
                 break
         return location
@@ -253,7 +271,7 @@ class Naukri(Scraper):
                         max_salary *= 10000000
 
                     log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
-                    return Compensation(
+                    return Compensation.create(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
@@ -290,15 +308,16 @@ class Naukri(Scraper):
         log.debug("No date parsed")
         return None
 
-    def _infer_work_from_home_type(self, placeholders: list[dict], title: str, description: str) -> Optional[str]:
+    def _infer_work_from_home_type(self, placeholders: list[dict], title: str, description: TextFeatures) -> Optional[str]:
         """
         Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
+        :param description: text_features of the job description
         """
-        location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "")
+        features = [text_features(text) for text in (location_str, title)] + [description]
+        if any(feature.hybrid for feature in features):
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif any(feature.remote for feature in features):
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
-            return "Work from office"
-        return None
\ No newline at end of file
+        # neither hybrid nor remote is mentioned anywhere
+        return "Work from office"
\ No newline at end of file
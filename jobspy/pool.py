@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+
+
+class SessionPool:
+    """
+    Keeps the sessions of finished scrapes for the next scrape of the same site with
+    the same proxies and session settings, so open connections, TLS sessions and
+    cookies carry over between scrape_jobs calls of a long-lived process.
+    A session is used by one scraper at a time: create_session takes an idle one
+    out of the pool and the scraper hands it back once its scrape is done.
+    """
+
+    _default: SessionPool | None = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, max_idle: int = 4):
+        """
+        :param max_idle: idle sessions kept per site and settings, the ones handed
+            back beyond it are closed
+        """
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self._idle: dict[tuple, list] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> SessionPool:
+        """
+        Returns the pool shared by all calls that don't pass their own
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def acquire(self, key: tuple):
+        """
+        :return: an idle session created for key, None if there is none
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            self.reused += 1
+            return idle.pop()
+
+    def add(self, key: tuple, session):
+        """
+        Registers a session created for key, handed back to the pool by release
+        """
+        session.pool = self
+        session.pool_key = key
+        with self._lock:
+            self.created += 1
+
+    def release(self, session):
+        with self._lock:
+            idle = self._idle[session.pool_key]
+            if session in idle:
+                return
+            if len(idle) < self.max_idle:
+                idle.append(session)
+                return
+        _close(session)
+
+    def clear(self):
+        """
+        Closes every idle session
+        """
+        with self._lock:
+            sessions = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+        for session in sessions:
+            _close(session)
+
+    def stats(self) -> dict:
+        with self._lock:
+            idle = sum(len(sessions) for sessions in self._idle.values())
+        return {"created": self.created, "reused": self.reused, "idle": idle}
+
+
+def _close(session):
+    # older tls_client sessions have nothing to close
+    close = getattr(session, "close", None)
+    if close is not None:
+        close()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from jobspy.util import create_logger
+
+log = create_logger("Profiler")
+
+_POOL_THREAD_SUFFIX = re.compile(r"_\d+$")
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread of the process at a fixed interval and writes
+    them as collapsed stacks ("thread;frame;frame count" lines), the input of
+    flamegraph.pl, speedscope and similar tools.
+    Each stack is rooted at its thread's name with the pool index dropped, so the
+    threads of a pool add up to one tower. Threads idling in a pool aren't sampled.
+    """
+
+    def __init__(self, path: str, interval: float = 0.005):
+        """
+        :param path: file the collapsed stacks are appended to, or a directory that
+            gets a new file per profile
+        :param interval: seconds between samples
+        """
+        self.path = path
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._labels: dict = {}
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="jobspy-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> str:
+        """
+        Stops sampling and writes the profile
+        :return: file written
+        """
+        self._stop.set()
+        self._thread.join()
+        path = self.path
+        if os.path.isdir(path):
+            path = os.path.join(path, f"jobspy-{os.getpid()}-{time.time_ns()}.folded")
+        with open(path, "a", encoding="utf-8") as f:
+            for stack, count in self.samples.items():
+                f.write(f"{stack} {count}\n")
+        log.info(f"{sum(self.samples.values())} samples written to {path}")
+        return path
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or _is_idle(frame):
+                    continue
+                name = _POOL_THREAD_SUFFIX.sub("", names.get(thread_id, "thread"))
+                self.samples[self._collapse(name, frame)] += 1
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = _label(code)
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+
+def _label(code) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    # module names are short enough to keep the frames readable, e.g. bs4/__init__
+    parts = code.co_filename.replace("\\", "/").rsplit("/", 2)
+    filename = "/".join(parts[-2:])
+    return f"{name} ({filename})".replace(";", ",")
+
+
+def _is_idle(frame) -> bool:
+    # an executor thread waiting for work blocks in the C level SimpleQueue.get,
+    # leaving its _worker loop as the innermost Python frame
+    code = frame.f_code
+    return code.co_name == "_worker" and code.co_filename.endswith(
+        os.path.join("concurrent", "futures", "thread.py")
+    )
+
+
+_active: SamplingProfiler | None = None
+_active_lock = threading.Lock()
+
+
+def _start_from_env() -> SamplingProfiler | None:
+    """
+    Starts a profiler when JOBSPY_PROFILE names an output and none is running
+    """
+    global _active
+    path = os.environ.get("JOBSPY_PROFILE")
+    if not path:
+        return None
+    with _active_lock:
+        if _active is not None:
+            return None
+        interval = float(os.environ.get("JOBSPY_PROFILE_INTERVAL", 0.005))
+        _active = SamplingProfiler(path, interval)
+    _active.start()
+    return _active
+
+
+def _stop(profiler: SamplingProfiler | None):
+    global _active
+    if profiler is None:
+        return
+    try:
+        profiler.stop()
+    finally:
+        with _active_lock:
+            _active = None
+
+
+def profiled(func):
+    """
+    Profiles every call of func, a function, coroutine function or generator
+    function, while the JOBSPY_PROFILE environment variable is set. Calls made while
+    a profile is already being taken are part of that profile.
+    """
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            profiler = _start_from_env()
+            try:
+                yield from func(*args, **kwargs)
+            finally:
+                _stop(profiler)
+
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profiler = _start_from_env()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _stop(profiler)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _start_from_env()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stop(profiler)
+
+    return wrapper
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import random
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+# responses that tell a proxy is blocked, throttled or broken rather than the request
+PROXY_ERROR_STATUS_CODES = {403, 407, 429, 999}
+DIRECT = "localhost"
+
+
+def format_proxy(proxy: str) -> dict:
+    """
+    :return: the requests proxies mapping of a proxy string, {} for "localhost"
+        which means no proxy
+    """
+    if proxy == DIRECT:
+        return {}
+    if proxy.startswith(("http://", "https://", "socks5://")):
+        return {"http": proxy, "https": proxy}
+    return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+
+
+class ProxyHealth:
+    """
+    Track record of one proxy on one host
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.latency: float | None = None  # moving average of healthy responses
+        self.error_rate = 0.0  # moving average of failed requests
+        self.consecutive_errors = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "ejections": self.ejections,
+            "ejected": self.ejected_until > time.monotonic(),
+        }
+
+
+class ProxyPool:
+    """
+    Picks the proxy of each request by its health on the request's host, in place
+    of a blind round robin. Latency and error rate are tracked per proxy and host,
+    faster and more reliable proxies get proportionally more requests. A proxy that
+    fails eject_after times in a row (errors, timeouts, 403, 429 and 5xx) is ejected
+    from the host for a cooldown that doubles with every ejection; afterwards it is
+    probed again, one more failure ejects it right away and a success restores it.
+    A request made with an affinity key goes through the proxy the key was first
+    used with while that proxy is healthy, e.g. detail pages through the proxy that
+    fetched their search page.
+    """
+
+    _shared: dict[tuple, ProxyPool] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        proxies: list[str] | str,
+        eject_after: int = 3,
+        cooldown: float = 30,
+        max_cooldown: float = 600,
+        max_affinities: int = 10_000,
+    ):
+        """
+        :param proxies: proxy strings, "localhost" meaning a direct connection
+        :param eject_after: consecutive failures on a host that eject a proxy from it
+        :param cooldown: seconds of the first ejection
+        :param max_cooldown: seconds the doubling cooldown is capped at
+        :param max_affinities: affinity keys remembered, the oldest are forgotten
+        """
+        if isinstance(proxies, str):
+            proxies = [proxies]
+        self.proxies = list(dict.fromkeys(proxies))
+        self.mappings = {proxy: format_proxy(proxy) for proxy in self.proxies}
+        self.eject_after = eject_after
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_affinities = max_affinities
+        self._health: dict[tuple[str, str], ProxyHealth] = {}
+        self._affinities: OrderedDict[object, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, proxies: list[str] | str) -> ProxyPool:
+        """
+        Returns the pool of a proxy list shared by every session using the same list,
+        so what one scrape learns about a proxy carries over to the next
+        """
+        key = (proxies,) if isinstance(proxies, str) else tuple(proxies)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(list(key))
+            return cls._shared[key]
+
+    def choose(self, url: str, affinity=None, exclude: str | None = None) -> str:
+        """
+        :param url: url of the request
+        :param affinity: key whose requests stick to the proxy it was first used with
+        :param exclude: proxy to avoid unless it is the only one available
+        :return: proxy to send the request through
+        """
+        host = urlsplit(url).hostname or ""
+        now = time.monotonic()
+        with self._lock:
+            if affinity is not None and affinity in self._affinities:
+                proxy = self._affinities[affinity]
+                if self._health_of(proxy, host).ejected_until <= now:
+                    self._affinities.move_to_end(affinity)
+                    return proxy
+
+            healths = {proxy: self._health_of(proxy, host) for proxy in self.proxies}
+            available = [
+                proxy
+                for proxy, health in healths.items()
+                if health.ejected_until <= now
+            ]
+            if exclude is not None and len(available) > 1:
+                available = [proxy for proxy in available if proxy != exclude]
+            if available:
+                proxy = self._weighted_choice(available, healths)
+            else:
+                # every proxy is ejected, the one coming back first is the best bet
+                proxy = min(self.proxies, key=lambda p: healths[p].ejected_until)
+
+            if affinity is not None:
+                self._affinities[affinity] = proxy
+                self._affinities.move_to_end(affinity)
+                while len(self._affinities) > self.max_affinities:
+                    self._affinities.popitem(last=False)
+            return proxy
+
+    def observe(self, proxy: str, url: str, status_code: int | None, latency: float):
+        """
+        Records the outcome of a request sent through proxy
+        :param status_code: status of the response, None when the request failed
+        :param latency: seconds the request took
+        """
+        host = urlsplit(url).hostname or ""
+        failed = (
+            status_code is None
+            or status_code in PROXY_ERROR_STATUS_CODES
+            or status_code >= 500
+        )
+        with self._lock:
+            health = self._health_of(proxy, host)
+            health.requests += 1
+            health.error_rate += 0.2 * (failed - health.error_rate)
+            if status_code == 429:
+                health.throttled += 1
+            if not failed:
+                health.consecutive_errors = 0
+                health.ejections = 0
+                health.latency = (
+                    latency
+                    if health.latency is None
+                    else health.latency + 0.2 * (latency - health.latency)
+                )
+                return
+            health.errors += 1
+            health.consecutive_errors += 1
+            if health.consecutive_errors >= self.eject_after:
+                health.ejections += 1
+                cooldown = self.cooldown * 2 ** (health.ejections - 1)
+                health.ejected_until = time.monotonic() + min(
+                    cooldown, self.max_cooldown
+                )
+                # a probe after the cooldown gets a single chance
+                health.consecutive_errors = self.eject_after - 1
+
+    def stats(self) -> dict:
+        """
+        :return: proxy -> host -> health
+        """
+        with self._lock:
+            result: dict[str, dict] = {}
+            for (proxy, host), health in self._health.items():
+                result.setdefault(proxy, {})[host] = health.to_dict()
+            return result
+
+    def _health_of(self, proxy: str, host: str) -> ProxyHealth:
+        key = (proxy, host)
+        health = self._health.get(key)
+        if health is None:
+            health = self._health[key] = ProxyHealth()
+        return health
+
+    @staticmethod
+    def _weighted_choice(proxies: list[str], healths: dict[str, ProxyHealth]) -> str:
+        if len(proxies) == 1:
+            return proxies[0]
+        latencies = [
+            healths[proxy].latency
+            for proxy in proxies
+            if healths[proxy].latency is not None
+        ]
+        # untried proxies are assumed as fast as a typical one, so they get tried
+        typical = statistics.median(latencies) if latencies else 1.0
+        weights = []
+        for proxy in proxies:
+            health = healths[proxy]
+            latency = health.latency if health.latency is not None else typical
+            weights.append((1 - health.error_rate) ** 2 / max(latency, 0.01) + 1e-6)
+        return random.choices(proxies, weights)[0]
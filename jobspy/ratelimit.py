@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header given either in seconds or as an HTTP date
+    :return: seconds to wait
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Paces requests to one host. The refill rate grows additively on every healthy
+    response and is cut multiplicatively on a throttling one (AIMD). A bucket
+    without a rate does not pace until the host first pushes back.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        decrease: float,
+        fallback_rate: float,
+    ):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.fallback_rate = fallback_rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until the host may be sent another request
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.rate is None:
+                        return
+                    capacity = max(1.0, self.rate)
+                    elapsed = now - self.updated
+                    self.tokens = min(capacity, self.tokens + elapsed * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            if self.rate is not None:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: float | None = None):
+        with self._lock:
+            rate = self.rate if self.rate is not None else self.fallback_rate
+            self.rate = max(self.min_rate, rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.blocked_until = max(
+                    self.blocked_until, time.monotonic() + retry_after
+                )
+
+
+class RateController:
+    """
+    Keeps a TokenBucket per host and adjusts it from the responses observed by the
+    sessions sharing the controller, honouring Retry-After on 429 and 5xx responses.
+    Detail page requests have buckets of their own, so pacing a board's search pages
+    doesn't hold back the detail fetches running alongside them.
+    """
+
+    _default: RateController | None = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        min_rate: float = 0.05,
+        max_rate: float = 10.0,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+        fallback_rate: float = 1.0,
+    ):
+        """
+        :param min_rate: lowest requests per second a throttled host is cut down to
+        :param max_rate: highest requests per second a healthy host is raised to
+        :param increase: requests per second added after each healthy response
+        :param decrease: factor applied to the rate after a throttling response
+        :param fallback_rate: rate assumed for an unpaced host when it first throttles
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.fallback_rate = fallback_rate
+        self._buckets: dict[tuple[str, bool], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> RateController:
+        """
+        Returns the controller shared by sessions that aren't given their own, so
+        what was learned about a host carries over to later scrapes
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def bucket(
+        self, url: str, rate: float | None = None, kind: str | None = None
+    ) -> TokenBucket:
+        """
+        :param url: request url, buckets are keyed by its host
+        :param rate: initial requests per second if the host has no bucket yet
+        :param kind: kind of the request, "detail" requests get a bucket of their own
+        """
+        key = (urlsplit(url).hostname or "", kind == "detail")
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(
+                    rate=rate,
+                    min_rate=self.min_rate,
+                    max_rate=self.max_rate,
+                    increase=self.increase,
+                    decrease=self.decrease,
+                    fallback_rate=self.fallback_rate,
+                )
+            return self._buckets[key]
+
+    def acquire(self, url: str, rate: float | None = None, kind: str | None = None):
+        self.bucket(url, rate, kind).acquire()
+
+    def observe(
+        self, url: str, status_code: int | None, headers=None, kind: str | None = None
+    ):
+        """
+        Feeds a response back into the host's bucket
+        :param status_code: response status code, None if the request failed
+        :param headers: response headers
+        :param kind: kind of the request
+        """
+        bucket = self.bucket(url, kind=kind)
+        if status_code is None or status_code in THROTTLE_STATUS_CODES:
+            retry_after = headers.get("Retry-After") if headers else None
+            bucket.on_throttle(parse_retry_after(retry_after))
+        else:
+            bucket.on_success()
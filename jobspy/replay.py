@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+
+from jobspy.cache import HttpCache
+from jobspy.exception import ReplayException
+
+
+class HttpArchive:
+    """
+    Records every request/response pair of the sessions created with it to a compact
+    archive, or replays such an archive so scrapers run fully offline.
+    The archive is a gzip file of JSON lines, one line per exchange, appended as the
+    responses come in. In replay mode a request is answered by the recorded responses
+    of the same method, url, params and body, in the order they were recorded, and a
+    request nothing was recorded for fails unless fallback is on.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency: float | str | None = None,
+        pace: bool = False,
+        fallback: bool = False,
+    ):
+        """
+        :param path: archive file, overwritten in record mode
+        :param mode: "record" or "replay"
+        :param latency: delay of replayed responses, seconds or "recorded" for the
+            time each response took when it was recorded, None replays instantly
+        :param pace: also pace replayed requests with the rate controller like live
+            ones, replay skips it otherwise
+        :param fallback: answer a request nothing was recorded for with a response
+            recorded for the same url path and not replayed yet. Such a response may
+            belong to another query, so this is off by default and every fallback is
+            logged and counted.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid archive mode: '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.pace = pace
+        self.fallback = fallback
+        self.recorded = 0
+        self.replayed = 0
+        self.fallbacks = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # request key / url path -> recorded exchanges, both indexes hold the same
+        # exchange dicts and an exchange replayed through either is marked consumed
+        self._exchanges: dict[str, deque[dict]] = {}
+        self._by_path: dict[str, deque[dict]] = {}
+        from jobspy.util import create_logger
+
+        self._log = create_logger("Replay")
+        if self.replaying:
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            open(path, "wb").close()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(method: str, url: str, request: dict) -> str:
+        return HttpCache.key(
+            method, url, request.get("params"), request.get("data"), request.get("json")
+        )
+
+    @staticmethod
+    def path_key(method: str, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{method.upper()} {parts.netloc}{parts.path}"
+
+    def recorder(self, method: str, url: str, request: dict, send):
+        """
+        :return: send wrapped to record the response it returns
+        """
+
+        def send_and_record():
+            start = time.perf_counter()
+            response = send()
+            self.record(method, url, request, response, time.perf_counter() - start)
+            return response
+
+        return send_and_record
+
+    def record(self, method: str, url: str, request: dict, response, elapsed=0.0):
+        content = response.content or b""
+        try:
+            body, binary = content.decode("utf-8"), False
+        except UnicodeDecodeError:
+            body, binary = base64.b64encode(content).decode("ascii"), True
+        exchange = {
+            "key": self.key(method, url, request),
+            "path": self.path_key(method, url),
+            "method": method.upper(),
+            "url": url,
+            "params": request.get("params"),
+            "data": request.get("data"),
+            "json": request.get("json"),
+            "status_code": response.status_code,
+            "response_url": str(response.url or url),
+            "headers": dict(response.headers),
+            "elapsed": round(elapsed, 4),
+            "binary": binary,
+            "body": body,
+        }
+        line = json.dumps(exchange, default=str).encode() + b"\n"
+        with self._lock:
+            # every exchange is its own gzip member, so the archive stays readable
+            # however the run ends
+            with open(self.path, "ab") as f:
+                f.write(gzip.compress(line))
+            self.recorded += 1
+
+    def replay(self, method: str, url: str, request: dict) -> requests.Response:
+        """
+        :return: the recorded response of the request, after the latency
+        :raises ReplayException: when nothing was recorded for the request, and with
+            fallback when nothing left was recorded for its url path either
+        """
+        with self._lock:
+            exchange = self._next(self._exchanges.get(self.key(method, url, request)))
+            fallback = exchange is None and self.fallback
+            if fallback:
+                exchange = self._next_unconsumed(
+                    self._by_path.get(self.path_key(method, url))
+                )
+            if exchange is None:
+                self.misses += 1
+            else:
+                self.replayed += 1
+                self.fallbacks += fallback
+        if exchange is None:
+            self._log.warning(f"No recorded response for {method.upper()} {url}")
+            raise ReplayException(f"No recorded response for {method.upper()} {url}")
+        if fallback:
+            self._log.warning(
+                f"Replaying {method.upper()} {url} with the response recorded for "
+                f"{exchange['url']} {exchange['params'] or ''}".rstrip()
+            )
+
+        delay = exchange["elapsed"] if self.latency == "recorded" else self.latency
+        if delay:
+            time.sleep(delay)
+        content = exchange["body"].encode()
+        if exchange["binary"]:
+            content = base64.b64decode(content)
+        meta = {
+            "url": exchange["response_url"],
+            "status_code": exchange["status_code"],
+            "headers": exchange["headers"],
+        }
+        return HttpCache._build_response(meta, content)
+
+    def stats(self) -> dict:
+        return {
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "fallbacks": self.fallbacks,
+            "misses": self.misses,
+        }
+
+    @staticmethod
+    def _next_unconsumed(exchanges: deque[dict] | None) -> dict | None:
+        """
+        :return: the first exchange not replayed yet, marked consumed
+        """
+        while exchanges and exchanges[0]["consumed"]:
+            exchanges.popleft()
+        if not exchanges:
+            return None
+        exchange = exchanges.popleft()
+        exchange["consumed"] = True
+        return exchange
+
+    @staticmethod
+    def _next(exchanges: deque[dict] | None) -> dict | None:
+        """
+        :return: the next exchange recorded for a request, marked consumed. The last
+            one is kept to answer repeats of the request.
+        """
+        if not exchanges:
+            return None
+        while len(exchanges) > 1 and exchanges[0]["consumed"]:
+            exchanges.popleft()
+        exchange = exchanges.popleft() if len(exchanges) > 1 else exchanges[0]
+        exchange["consumed"] = True
+        return exchange
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                exchange["consumed"] = False
+                self._exchanges.setdefault(exchange["key"], deque()).append(exchange)
+                self._by_path.setdefault(exchange["path"], deque()).append(exchange)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from jobspy.ratelimit import parse_retry_after
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """
+    Fails the requests to a host fast once it keeps failing. After threshold failed
+    requests in a row the circuit opens for reset_timeout seconds, then a single
+    trial request is let through: its success closes the circuit, a failure opens
+    it again.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 60):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._trial = True
+            return True
+
+    def record(self, success: bool):
+        with self._lock:
+            self._trial = False
+            if success:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+    @property
+    def open(self) -> bool:
+        return self.opened_at is not None
+
+
+class RetryPolicy:
+    """
+    Retries of the requests of one scrape_jobs call, shared by all its sessions.
+    Failed requests (errors, 429 and 5xx responses) are retried after a decorrelated
+    jitter backoff, or the server's Retry-After when longer. Retries draw from a
+    budget for the whole run, so a struggling board can't multiply the run's
+    requests, and each host has a circuit breaker so a board that blocks the run
+    fails fast instead of tying up workers on backoffs.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8,
+        max_retry_after: float = 30,
+        budget: int = 100,
+        breaker_threshold: int = 5,
+        breaker_timeout: float = 60,
+    ):
+        """
+        :param attempts: tries of a request, the first one included
+        :param base_delay: seconds of the shortest backoff
+        :param max_delay: seconds a backoff is capped at
+        :param max_retry_after: longest Retry-After honoured, a request asked to wait
+            longer is not retried
+        :param budget: retries allowed over the whole run
+        :param breaker_threshold: failed requests in a row that open a host's circuit
+        :param breaker_timeout: seconds an open circuit fails requests before a trial
+        """
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.breaker_threshold = breaker_threshold
+        self.breaker_timeout = breaker_timeout
+        self.retries = 0
+        self.exhausted = 0
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    self.breaker_threshold, self.breaker_timeout
+                )
+            return self._breakers[host]
+
+    def allow(self, url: str) -> bool:
+        """
+        :return: False while the host's circuit is open
+        """
+        return self.breaker(url).allow()
+
+    @staticmethod
+    def circuit_open_response(url: str) -> requests.Response:
+        """
+        Stands in for a request not sent because its host's circuit is open: a 503
+        the scrapers handle like any failure of the host, ending that site's scrape
+        or skipping that job instead of aborting the whole run
+        """
+        response = requests.Response()
+        response.status_code = 503
+        response.reason = "Circuit Open"
+        response.url = url
+        response._content = b""
+        return response
+
+    @staticmethod
+    def failed(response) -> bool:
+        return response is None or response.status_code in RETRY_STATUS_CODES
+
+    def backoff(
+        self, attempt: int, previous: float, response=None, base: float | None = None
+    ) -> float | None:
+        """
+        :param attempt: number of the attempt that failed, starting at 1
+        :param previous: the previous backoff, 0 before the first retry
+        :param response: the failed response, None when the request raised
+        :param base: shortest backoff of the session, the policy's if None
+        :return: seconds to wait before the next attempt, None when the request
+            should not be retried
+        """
+        if attempt >= self.attempts:
+            return None
+        base = base if base is not None else self.base_delay
+        # decorrelated jitter: spreads the retries of concurrent requests apart
+        delay = min(self.max_delay, random.uniform(base, max(base, previous * 3)))
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+        with self._lock:
+            if self.retries >= self.budget:
+                self.exhausted += 1
+                return None
+            self.retries += 1
+        return delay
+
+    def stats(self) -> dict:
+        with self._lock:
+            open_hosts = [host for host, b in self._breakers.items() if b.open]
+            return {
+                "retries": self.retries,
+                "budget": self.budget,
+                "exhausted": self.exhausted,
+                "open_circuits": open_hosts,
+            }
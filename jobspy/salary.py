@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import SalarySource
+from jobspy.util import SALARY_PATTERN
+
+SALARY_COLUMNS = [
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "salary_source",
+]
+ANNUAL_FACTORS = {"hourly": 2080, "monthly": 12, "weekly": 52, "daily": 260}
+
+
+def extract_salaries(
+    descriptions: pd.Series,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    Vectorized extract_salary: parses the first salary range of every description
+    at once, with the same thresholds and limits
+    :param descriptions: Series of description texts
+    :return: DataFrame of interval, min_amount, max_amount and currency aligned with
+        descriptions, NaN where no valid range was found
+    """
+    parts = descriptions.astype("string").str.extract(SALARY_PATTERN)
+
+    def to_number(values: pd.Series) -> np.ndarray:
+        numbers = pd.to_numeric(values.str.replace(",", ""), errors="coerce")
+        return np.trunc(numbers.to_numpy(dtype=float, na_value=np.nan))
+
+    has_k = (
+        parts["min_k"].str.lower().eq("k") | parts["max_k"].str.lower().eq("k")
+    ).to_numpy(dtype=bool, na_value=False)
+    min_salary = to_number(parts["min_salary"]) * np.where(has_k, 1000, 1)
+    max_salary = to_number(parts["max_salary"]) * np.where(has_k, 1000, 1)
+
+    hourly = min_salary < hourly_threshold
+    monthly = ~hourly & (min_salary < monthly_threshold)
+    annual_min = np.select(
+        [hourly, monthly], [min_salary * 2080, min_salary * 12], min_salary
+    )
+    annual_max = np.select(
+        [
+            hourly & (max_salary < hourly_threshold),
+            monthly & (max_salary < monthly_threshold),
+            hourly | monthly,
+        ],
+        [max_salary * 2080, max_salary * 12, np.nan],
+        max_salary,
+    )
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (annual_max != 0)
+            & (lower_limit <= annual_min)
+            & (annual_min <= upper_limit)
+            & (lower_limit <= annual_max)
+            & (annual_max <= upper_limit)
+            & (annual_min < annual_max)
+        )
+    if enforce_annual_salary:
+        min_salary, max_salary = annual_min, annual_max
+    interval = np.select([hourly, monthly], ["hourly", "monthly"], "yearly")
+    return pd.DataFrame(
+        {
+            "interval": np.where(valid, interval, None),
+            "min_amount": np.where(valid, min_salary, np.nan),
+            "max_amount": np.where(valid, max_salary, np.nan),
+            "currency": np.where(valid, "USD", None),
+        },
+        index=descriptions.index,
+    )
+
+
+def derive_salaries(
+    jobs: pd.DataFrame, enforce_annual_salary: bool = False, **limits
+) -> pd.DataFrame:
+    """
+    Salary stage of scrape_jobs over a whole DataFrame, e.g. to re-derive stored
+    rows without scraping them again. Rows without salary data from the job board
+    get the salary parsed from their description, rows with it are annualized when
+    enforce_annual_salary is set.
+    :param jobs: DataFrame with the description and salary columns of scrape_jobs
+    :param limits: thresholds and limits of extract_salary to override
+    :return: copy of jobs with the salary columns re-derived
+    """
+    jobs = jobs.copy()
+    for column in SALARY_COLUMNS + ["description"]:
+        if column not in jobs.columns:
+            jobs[column] = None
+
+    direct = (jobs["salary_source"] == SalarySource.DIRECT_DATA.value).to_numpy(
+        dtype=bool, na_value=False
+    )
+    if (~direct).any():
+        parsed = extract_salaries(
+            jobs.loc[~direct, "description"],
+            enforce_annual_salary=enforce_annual_salary,
+            **limits,
+        )
+        for column in parsed.columns:
+            jobs[column] = jobs[column].astype(object)
+            jobs.loc[~direct, column] = parsed[column].to_numpy()
+        jobs.loc[~direct, "salary_source"] = SalarySource.DESCRIPTION.value
+
+    if enforce_annual_salary:
+        min_amount = pd.to_numeric(jobs["min_amount"], errors="coerce")
+        max_amount = pd.to_numeric(jobs["max_amount"], errors="coerce")
+        factor = jobs["interval"].map(ANNUAL_FACTORS).fillna(1)
+        convert = (
+            direct
+            & jobs["interval"].notna().to_numpy()
+            & (jobs["interval"] != "yearly").to_numpy()
+            & (min_amount.fillna(0) != 0).to_numpy()
+            & (max_amount.fillna(0) != 0).to_numpy()
+        )
+        jobs["min_amount"] = min_amount.where(~convert, min_amount * factor)
+        jobs["max_amount"] = max_amount.where(~convert, max_amount * factor)
+        jobs.loc[convert, "interval"] = "yearly"
+
+    jobs["min_amount"] = pd.to_numeric(jobs["min_amount"], errors="coerce")
+    jobs["max_amount"] = pd.to_numeric(jobs["max_amount"], errors="coerce")
+    jobs["salary_source"] = jobs["salary_source"].astype(object)
+    jobs.loc[jobs["min_amount"].fillna(0) == 0, "salary_source"] = None
+    return jobs
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Scheduler:
+    """
+    Coordinates the concurrency of scrape_jobs calls.
+    Sites run on one persistent pool and page/detail fetches on another, so threads
+    are reused across calls. Every request sent through a session created with the
+    scheduler holds a global and a per-host slot while in flight, bounding the number
+    of open sockets however many searches run at once.
+    """
+
+    _default: Scheduler | None = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_sites: int = 32,
+        max_workers: int = 32,
+        max_in_flight: int = 64,
+        max_per_host: int = 8,
+        host_limits: dict[str, int] | None = None,
+    ):
+        """
+        :param max_sites: number of site scrapers running at once
+        :param max_workers: number of threads for page and detail fetches
+        :param max_in_flight: number of requests in flight across all hosts
+        :param max_per_host: number of requests in flight per host
+        :param host_limits: per-host overrides of max_per_host, e.g. {"www.linkedin.com": 2}
+        """
+        self.max_per_host = max_per_host
+        self.host_limits = host_limits or {}
+        self.site_executor = ThreadPoolExecutor(
+            max_workers=max_sites, thread_name_prefix="jobspy-site"
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jobspy-fetch"
+        )
+        self._max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_host_connections(self) -> int:
+        """
+        Most requests in flight to one host at once, the connection pool size a
+        session needs to keep all of them open
+        """
+        max_per_host = max([self.max_per_host, *self.host_limits.values()])
+        return min(max_per_host, self._max_in_flight)
+
+    @classmethod
+    def default(cls) -> Scheduler:
+        """
+        Returns the scheduler shared by all calls that don't pass their own
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    # tasks run in a copy of the submitter's context, so context variables such as
+    # the stats being collected follow the work onto the pools' threads
+
+    def submit_site(self, fn: Callable[..., R], *args, **kwargs) -> Future[R]:
+        context = contextvars.copy_context()
+        return self.site_executor.submit(context.run, fn, *args, **kwargs)
+
+    def submit(self, fn: Callable[..., R], *args, **kwargs) -> Future[R]:
+        context = contextvars.copy_context()
+        return self.executor.submit(context.run, fn, *args, **kwargs)
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """
+        Runs fn over items on the fetch pool
+        :return: results in the order of items
+        """
+        futures = [self.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """
+        Holds a per-host and a global request slot for the duration of the block
+        """
+        host_slot = self._host_slot(urlsplit(url).hostname or "")
+        # the host slot comes first, so requests queued behind a busy host wait
+        # without holding one of the global slots other hosts could use
+        with host_slot, self._in_flight:
+            yield
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                limit = self.host_limits.get(host, self.max_per_host)
+                self._host_slots[host] = threading.BoundedSemaphore(limit)
+            return self._host_slots[host]
+
+    def shutdown(self, wait: bool = True):
+        self.site_executor.shutdown(wait=wait)
+        self.executor.shutdown(wait=wait)
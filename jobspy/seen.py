@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+
+class SeenStore:
+    """
+    Persistent set of the job ids returned by previous runs, for incremental scraping.
+    Ids are stored in the JobPost.id form (e.g. "li-3693012711") in a SQLite table
+    without rowids, which stays compact and indexed at tens of millions of ids.
+    """
+
+    def __init__(self, path: str = ".jobspy_seen.db"):
+        """
+        :param path: SQLite database file, created if missing (":memory:" for a
+            store that lasts for the process only)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen "
+            "(id TEXT PRIMARY KEY, first_seen REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def known(self, job_ids: Iterable[str]) -> set[str]:
+        """
+        :return: the ids of job_ids already in the store
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        found = set()
+        with self._lock:
+            # stays under SQLite's limit of host parameters per statement
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id FROM seen WHERE id IN ({placeholders})", chunk
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def add(self, job_ids: Iterable[str]):
+        """
+        Records job ids, ids already stored keep their first_seen time
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (id, first_seen) VALUES (?, ?)",
+                ((job_id, now) for job_id in job_ids if job_id),
+            )
+            self._conn.commit()
+
+    def prune(self, older_than: float):
+        """
+        Forgets ids first seen more than older_than seconds ago
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM seen WHERE first_seen < ?", (time.time() - older_than,)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+COUNTERS = (
+    "jobs",
+    "requests",
+    "pages",
+    "details",
+    "bytes",
+    "retries",
+    "short_circuited",
+    "rate_limited",
+    "cache_hits",
+    "duplicates_dropped",
+    "known_skipped",
+    "hedges",
+    "hedge_wins",
+)
+STAGES = ("fetch", "parse", "convert", "model")
+
+_current: ContextVar[SiteStats | None] = ContextVar("jobspy_stats", default=None)
+_in_stage: ContextVar[bool] = ContextVar("jobspy_stats_stage", default=False)
+
+
+class SiteStats:
+    """
+    Counters and stage timings of one site in a scrape. Stage times are summed over
+    all threads working for the site, so they can add up to more than its wall time.
+    """
+
+    def __init__(self, site: str):
+        self.site = site
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.times = dict.fromkeys(STAGES, 0.0)
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counts[name] += n
+
+    def add_time(self, stage: str, seconds: float):
+        with self._lock:
+            self.times[stage] += seconds
+
+    @property
+    def jobs_per_sec(self) -> float:
+        return self.counts["jobs"] / self.wall_time if self.wall_time else 0.0
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                **self.counts,
+                **{f"{stage}_time": seconds for stage, seconds in self.times.items()},
+                "wall_time": self.wall_time,
+                "jobs_per_sec": self.jobs_per_sec,
+            }
+
+    def __repr__(self):
+        return f"SiteStats({self.to_dict()})"
+
+
+class ScrapeStats:
+    """
+    Statistics of a scrape_jobs call, per site and in total. Pass an instance to
+    scrape_jobs to have it filled, a pandas result also carries them as a dict in
+    DataFrame.attrs["stats"].
+    """
+
+    def __init__(self):
+        self.sites: dict[str, SiteStats] = {}
+        self.wall_time = 0.0
+        # building the result from the scraped jobs, dedupe included
+        self.output_time = 0.0
+        self._lock = threading.Lock()
+
+    def site(self, site: str) -> SiteStats:
+        with self._lock:
+            if site not in self.sites:
+                self.sites[site] = SiteStats(site)
+            return self.sites[site]
+
+    @property
+    def jobs(self) -> int:
+        return sum(site.counts["jobs"] for site in self.sites.values())
+
+    @property
+    def jobs_per_sec(self) -> float:
+        return self.jobs / self.wall_time if self.wall_time else 0.0
+
+    @contextmanager
+    def collect(self, site: str) -> Iterator[SiteStats]:
+        """
+        Makes the site's stats the ones the hooks of the current context report to,
+        including the work it hands to the scheduler's threads
+        """
+        site_stats = self.site(site)
+        token = _current.set(site_stats)
+        start = time.perf_counter()
+        try:
+            yield site_stats
+        finally:
+            site_stats.wall_time += time.perf_counter() - start
+            _current.reset(token)
+
+    def to_dict(self) -> dict:
+        return {
+            "jobs": self.jobs,
+            "wall_time": self.wall_time,
+            "jobs_per_sec": self.jobs_per_sec,
+            "output_time": self.output_time,
+            "sites": {name: site.to_dict() for name, site in self.sites.items()},
+        }
+
+    def __repr__(self):
+        return f"ScrapeStats({self.to_dict()})"
+
+
+def current() -> SiteStats | None:
+    """
+    :return: the stats collected in the current context, None when disabled
+    """
+    return _current.get()
+
+
+def count(name: str, n: int = 1):
+    stats = _current.get()
+    if stats is not None:
+        stats.count(name, n)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Adds the time spent in the block to a stage. Nested stages count towards the
+    outermost one only, e.g. parsing done while converting counts as conversion.
+    """
+    stats = _current.get()
+    if stats is None or _in_stage.get():
+        yield
+        return
+    token = _in_stage.set(True)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(name, time.perf_counter() - start)
+        _in_stage.reset(token)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import requests
+import tls_client
+
+from jobspy.util import RotatingProxySession
+
+
+class TLSRotating(RotatingProxySession, tls_client.Session):
+    def __init__(self, proxies=None, **kwargs):
+        RotatingProxySession.__init__(self, proxies=proxies, **kwargs)
+        tls_client.Session.__init__(self, random_tls_extension_order=True)
+
+    def execute_request(self, method, url, kind=None, affinity=None, **kwargs):
+        def send(proxies):
+            if proxies is not None:
+                return tls_client.Session.execute_request(
+                    self, method, url, proxy=proxies, **kwargs
+                )
+            return tls_client.Session.execute_request(self, method, url, **kwargs)
+
+        response = self.dispatch(
+            method, url, self.proxied(url, affinity, send), kind, kwargs
+        )
+        if not isinstance(response, requests.Response):
+            response.ok = response.status_code in range(200, 400)
+        return response
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_current: ContextVar[Span | None] = ContextVar("jobspy_span", default=None)
+
+
+class Span:
+    """
+    A timed operation of a scrape, linked to the span that was active when it started
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+        "thread",
+    )
+
+    def __init__(self, name: str, parent: Span | None = None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes or {})
+        self.error: str | None = None
+        self.thread = threading.current_thread().name
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    def set(self, key: str, value):
+        self.attributes[key] = value
+
+    def end(self, error: BaseException | None = None):
+        """
+        Ends the span and hands it to the exporter, only the first call counts
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        if _exporter is not None:
+            _exporter.export(self)
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "thread": self.thread,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        return f"Span({self.name!r}, duration_ms={self.duration_ms})"
+
+
+class SpanExporter:
+    """
+    Receives every ended span. The base class drops them, subclasses send them
+    somewhere; export is called from the thread that ended the span.
+    """
+
+    def export(self, span: Span):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+class JsonLinesExporter(SpanExporter):
+    """
+    Appends each ended span to a file as one JSON line, either the flat Span.to_dict
+    form or, with otlp, an OTLP/JSON ExportTraceServiceRequest holding the span as
+    written by the OpenTelemetry collector's file exporter
+    """
+
+    def __init__(self, path: str, otlp: bool = False, service_name: str = "jobspy"):
+        self.path = path
+        self.otlp = otlp
+        self.service_name = service_name
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        record = self._otlp(span) if self.otlp else span.to_dict()
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def shutdown(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _otlp(self, span: Span) -> dict:
+        attributes = {**span.attributes, "thread.name": span.thread}
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            # SPAN_KIND_CLIENT for requests, SPAN_KIND_INTERNAL for the rest
+            "kind": 3 if span.name == "http.request" else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in attributes.items()
+                if value is not None
+            ],
+            # STATUS_CODE_ERROR or STATUS_CODE_UNSET
+            "status": {"code": 2, "message": span.error} if span.error else {},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": "jobspy"}, "spans": [otlp_span]}],
+                }
+            ]
+        }
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _exporter_from_env() -> SpanExporter | None:
+    path = os.environ.get("JOBSPY_TRACE_FILE")
+    if not path:
+        return None
+    return JsonLinesExporter(path, otlp=os.environ.get("JOBSPY_TRACE_FORMAT") == "otlp")
+
+
+_exporter: SpanExporter | None = _exporter_from_env()
+
+
+def set_trace_exporter(exporter: SpanExporter | None):
+    """
+    Sets where the spans of every scrape go
+    :param exporter: e.g. JsonLinesExporter("trace.jsonl", otlp=True), None disables
+        tracing (the default, unless the JOBSPY_TRACE_FILE environment variable names
+        a file, written in OTLP/JSON when JOBSPY_TRACE_FORMAT is "otlp")
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+
+
+def enabled() -> bool:
+    return _exporter is not None
+
+
+def current() -> Span | None:
+    """
+    :return: the span active in the current context
+    """
+    return _current.get()
+
+
+def start_span(name: str, parent: Span | None = None, **attributes) -> Span | None:
+    """
+    Starts a span without making it the active one, for work that outlives a block
+    :param parent: defaults to the active span
+    :return: the span, None when tracing is disabled
+    """
+    if _exporter is None:
+        return None
+    return Span(name, parent or _current.get(), attributes)
+
+
+@contextmanager
+def activate(span: Span | None) -> Iterator[Span | None]:
+    """
+    Makes span the parent of the spans started in the block, without ending it
+    """
+    if span is None:
+        yield None
+        return
+    token = _current.set(span)
+    try:
+        yield span
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span | None]:
+    """
+    Traces the block as a child of the active span, yields None when tracing is
+    disabled so attributes are set with "if span is not None"
+    """
+    if _exporter is None:
+        yield None
+        return
+    new_span = Span(name, _current.get(), attributes)
+    token = _current.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.end(e)
+        raise
+    finally:
+        _current.reset(token)
+        new_span.end()
+
+
+def traced(name=None):
+    """
+    Decorates a function or coroutine function to run in a span named after it,
+    used as @traced or @traced("name")
+    """
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    if callable(name):
+        func, name = name, None
+        return decorator(func)
+    return decorator
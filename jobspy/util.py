@@ -1,21 +1,48 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
-from itertools import cycle
+import time
+from functools import lru_cache, partial
+from typing import NamedTuple
 
-import numpy as np
 import requests
-import tls_client
 import urllib3
-from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
+from jobspy import stats, tracing
+from jobspy.cache import HttpCache
+from jobspy.description import default_store
+from jobspy.exception import ReplayException
+from jobspy.hedge import HedgePolicy
 from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.pool import SessionPool
+from jobspy.proxies import ProxyPool, format_proxy
+from jobspy.ratelimit import RateController
+from jobspy.replay import HttpArchive
+from jobspy.retry import RetryPolicy
+from jobspy.scheduler import Scheduler
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+def __getattr__(name: str):
+    # tls_client loads a native library, so its session is imported on first use
+    if name == "TLSRotating":
+        from jobspy.tls import TLSRotating
+
+        return TLSRotating
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _markdown():
+    from markdownify import MarkdownConverter
+
+    return MarkdownConverter()
+
+
 def create_logger(name: str):
     logger = logging.getLogger(f"JobSpy:{name}")
     logger.propagate = False
@@ -30,77 +57,298 @@ def create_logger(name: str):
 
 
 class RotatingProxySession:
-    def __init__(self, proxies=None):
-        if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
+    def __init__(
+        self,
+        proxies=None,
+        scheduler: Scheduler | None = None,
+        rate_controller: RateController | None = None,
+        rate_limit: float | None = None,
+        cache: HttpCache | None = None,
+        archive: HttpArchive | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        has_retry: bool = False,
+        delay: float | None = None,
+    ):
+        self.bind(
+            scheduler, rate_controller, rate_limit, cache, archive, retry_policy, hedge
+        )
+        # failed requests are retried by the retry policy, after at least delay
+        # seconds when given
+        self.has_retry = has_retry
+        self.retry_delay = delay
+        # set by the SessionPool the session is kept in, reused once it was handed
+        # out again
+        self.pool: SessionPool | None = None
+        self.pool_key: tuple | None = None
+        self.reused = False
+        if isinstance(proxies, ProxyPool):
+            self.proxy_pool = proxies
+        elif proxies:
+            self.proxy_pool = ProxyPool.shared(proxies)
         else:
-            self.proxy_cycle = None
+            self.proxy_pool = None
+
+    def bind(
+        self,
+        scheduler: Scheduler | None = None,
+        rate_controller: RateController | None = None,
+        rate_limit: float | None = None,
+        cache: HttpCache | None = None,
+        archive: HttpArchive | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+    ):
+        """
+        Sets the hooks every request of the session goes through
+        """
+        self.scheduler = scheduler
+        self.rate_controller = rate_controller
+        self.rate_limit = rate_limit
+        self.cache = cache
+        self.archive = archive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge = hedge
+
+    def release(self):
+        """
+        Hands the session back to its pool, for the next scrape of its site
+        """
+        if self.pool is not None:
+            self.pool.release(self)
 
     @staticmethod
     def format_proxy(proxy):
         """Utility method to format a proxy string into a dictionary."""
-        if proxy.startswith("http://") or proxy.startswith("https://"):
-            return {"http": proxy, "https": proxy}
-        if proxy.startswith("socks5://"):
-            return {"http": proxy, "https": proxy}
-        return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+        return format_proxy(proxy)
+
+    def proxied(self, url: str, affinity, send):
+        """
+        Routes a request through the proxy pool, which learns from its outcome
+        :param affinity: key of requests that should share a proxy, or None
+        :param send: callable performing the request through the proxies mapping it
+            is given, None meaning the session's own
+        :return: callable performing the request, called with hedge=True for a
+            duplicate of the request that should go through another proxy
+        """
+        if self.proxy_pool is None:
+            return lambda hedge=False: send(None)
+        picked = []
+
+        def send_through_proxy(hedge=False):
+            if hedge:
+                proxy = self.proxy_pool.choose(url, exclude=next(iter(picked), None))
+            else:
+                proxy = self.proxy_pool.choose(url, affinity)
+                picked.append(proxy)
+            start = time.perf_counter()
+            try:
+                response = send(self.proxy_pool.mappings[proxy])
+            except Exception:
+                self.proxy_pool.observe(proxy, url, None, time.perf_counter() - start)
+                raise
+            self.proxy_pool.observe(
+                proxy, url, response.status_code, time.perf_counter() - start
+            )
+            return response
+
+        return send_through_proxy
+
+    def dispatch(self, method: str, url: str, send, kind: str | None, request: dict):
+        """
+        Sends a request through the hooks shared by every session type
+        :param method: request method
+        :param url: request url
+        :param send: callable performing the actual request
+        :param kind: "search" or "detail" for requests that may be served from cache
+        :param request: keyword arguments of the request
+        :return: response
+        """
+        if not tracing.enabled():
+            return self._dispatch(method, url, send, kind, request)
+        with tracing.span(
+            "http.request", **{"http.method": method.upper(), "http.url": url}
+        ) as span:
+            if kind is not None:
+                span.set("jobspy.kind", kind)
+            response = self._dispatch(method, url, send, kind, request, span)
+            span.set("http.status_code", response.status_code)
+            span.set("http.response_bytes", len(response.content or b""))
+            return response
+
+    def _dispatch(
+        self, method: str, url: str, send, kind: str | None, request: dict, span=None
+    ):
+        site_stats = stats.current()
+        cache_key = None
+        if self.cache is not None and kind is not None:
+            cache_key = self.cache.key(
+                method,
+                url,
+                request.get("params"),
+                request.get("data"),
+                request.get("json"),
+                request.get("headers"),
+            )
+            response = self.cache.get(cache_key, kind)
+            if response is not None:
+                if site_stats is not None:
+                    site_stats.count("cache_hits")
+                if span is not None:
+                    span.set("jobspy.cache_hit", True)
+                if self.archive is not None and not self.archive.replaying:
+                    self.archive.record(method, url, request, response)
+                return response
+
+        rate_controller = self.rate_controller
+        if self.archive is not None:
+            if not self.archive.replaying:
+                send = self.archive.recorder(method, url, request, send)
+            else:
+                send = partial(self.archive.replay, method, url, request)
+                if not self.archive.pace:
+                    rate_controller = None
+        replaying = self.archive is not None and self.archive.replaying
+        policy = self.retry_policy
+        # the breakers only follow the sessions whose requests the policy retries
+        if self.has_retry and not policy.allow(url):
+            if site_stats is not None:
+                site_stats.count("short_circuited")
+            return policy.circuit_open_response(url)
+        start = time.perf_counter()
+        send_once = partial(
+            self._send_once, url, send, kind, rate_controller, span, start
+        )
+        # archives stay deterministic, a hedge would record or consume an exchange
+        if self.hedge is not None and kind == "detail" and self.archive is None:
+            submit = self.scheduler.submit if self.scheduler is not None else None
+            send_once = partial(self.hedge.send, url, send_once, submit)
+        attempt, delay = 0, 0.0
+        while True:
+            attempt += 1
+            response = error = None
+            try:
+                response = send_once()
+            except Exception as e:
+                error = e
+            if not self.has_retry or not policy.failed(response):
+                break
+            # an archive answers a request it has nothing for the same way every time
+            if isinstance(error, ReplayException):
+                break
+            # the slot is released while backing off, the next attempt queues again
+            delay = policy.backoff(attempt, delay, response, self.retry_delay)
+            if delay is None:
+                break
+            if site_stats is not None:
+                site_stats.count("retries")
+            if span is not None:
+                span.set("jobspy.retries", attempt)
+            if not replaying:
+                time.sleep(delay)
+        if self.has_retry:
+            policy.breaker(url).record(not policy.failed(response))
+        if error is not None:
+            raise error
+        if site_stats is not None:
+            self._count_response(site_stats, kind, response, start)
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    def _send_once(
+        self,
+        url: str,
+        send,
+        kind: str | None,
+        rate_controller: RateController | None,
+        span,
+        start: float,
+        hedge: bool = False,
+    ):
+        """
+        Sends a request once it got a rate token and a request slot, and feeds its
+        outcome back into the rate controller
+        :param hedge: whether the request duplicates a slow one
+        """
+        if rate_controller is not None:
+            # detail pages aren't paced until their host pushes back
+            rate = self.rate_limit if kind != "detail" else None
+            rate_controller.acquire(url, rate, kind)
+        response = None
+        try:
+            if self.scheduler is None:
+                response = self._send(send, span, start, hedge)
+            else:
+                with self.scheduler.slot(url):
+                    response = self._send(send, span, start, hedge)
+        finally:
+            if rate_controller is not None:
+                if response is None:
+                    rate_controller.observe(url, None, kind=kind)
+                else:
+                    rate_controller.observe(
+                        url, response.status_code, response.headers, kind
+                    )
+        return response
+
+    @staticmethod
+    def _send(send, span, start: float, hedge: bool = False):
+        if span is not None and not hedge:
+            # time spent waiting for the rate limit and a request slot
+            span.set("jobspy.queued_ms", (time.perf_counter() - start) * 1e3)
+        return send(hedge=True) if hedge else send()
+
+    @staticmethod
+    def _count_response(site_stats, kind: str | None, response, start: float):
+        site_stats.add_time("fetch", time.perf_counter() - start)
+        site_stats.count("requests")
+        if kind == "search":
+            site_stats.count("pages")
+        elif kind == "detail":
+            site_stats.count("details")
+        site_stats.count("bytes", len(response.content or b""))
+        if response.status_code == 429:
+            site_stats.count("rate_limited")
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        clear_cookies=False,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        **kwargs,
+    ):
+        RotatingProxySession.__init__(self, proxies=proxies, **kwargs)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
-        self.setup_session(has_retry, delay)
-
-    def setup_session(self, has_retry, delay):
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        self.setup_session(pool_maxsize)
 
-    def request(self, method, url, **kwargs):
+    def setup_session(self, pool_maxsize=DEFAULT_POOLSIZE):
+        # one connection per request the scheduler lets run at once on a host, the
+        # requests default of 10 drops the connections of busier pools. Retries are
+        # done by the session's retry policy, not by urllib3
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, kind=None, affinity=None, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        def send(proxies):
+            if proxies is not None:
+                # per request, the session is shared by the scraper's threads
+                return requests.Session.request(
+                    self, method, url, proxies=proxies, **kwargs
+                )
+            return requests.Session.request(self, method, url, **kwargs)
 
-
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
-
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
-        return response
+        return self.dispatch(
+            method, url, self.proxied(url, affinity, send), kind, kwargs
+        )
 
 
 def create_session(
@@ -109,25 +357,85 @@ def create_session(
     ca_cert: str | None = None,
     is_tls: bool = True,
     has_retry: bool = False,
-    delay: int = 1,
+    delay: float | None = None,
     clear_cookies: bool = False,
+    scheduler: Scheduler | None = None,
+    rate_controller: RateController | None = None,
+    rate_limit: float | None = None,
+    cache: HttpCache | None = None,
+    archive: HttpArchive | None = None,
+    retry: RetryPolicy | None = None,
+    hedge: HedgePolicy | None = None,
+    pool: SessionPool | None = None,
+    pool_scope: str | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    With a scheduler, every request waits for a free global and per-host slot.
+    Requests are paced per host by the rate controller (the shared default one unless
+    given), rate_limit is the initial requests per second for hosts it hasn't seen.
+    kind="detail" requests are paced apart from the rest and without rate_limit, only
+    once their host throttles them.
+    With a cache, requests sent with kind="search" or kind="detail" are cached.
+    With an archive, every exchange is recorded to it or answered from it.
+    With has_retry, failed requests are retried by the retry policy (one of the
+    session's own unless given), waiting at least delay seconds between attempts.
+    With a hedge policy, slow kind="detail" requests are hedged.
+    With a pool, an idle session of an earlier scrape with the same pool_scope (the
+    site) and settings is reused, session.release() hands it back.
     :return: A session object
     """
+    hooks = dict(
+        scheduler=scheduler,
+        rate_controller=rate_controller or RateController.default(),
+        rate_limit=rate_limit,
+        cache=cache,
+        archive=archive,
+        retry_policy=retry,
+        hedge=hedge,
+    )
+    pool_maxsize = (
+        scheduler.max_host_connections if scheduler is not None else DEFAULT_POOLSIZE
+    )
+    key = None
+    if pool is not None:
+        proxy_key = tuple(proxies) if isinstance(proxies, list) else proxies
+        key = (
+            pool_scope,
+            is_tls,
+            proxy_key,
+            ca_cert,
+            has_retry,
+            delay,
+            clear_cookies,
+            pool_maxsize,
+        )
+        session = pool.acquire(key)
+        if session is not None:
+            session.bind(**hooks)
+            session.reused = True
+            return session
+
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        from jobspy.tls import TLSRotating
+
+        session = TLSRotating(
+            proxies=proxies, has_retry=has_retry, delay=delay, **hooks
+        )
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            pool_maxsize=pool_maxsize,
+            **hooks,
         )
 
     if ca_cert:
         session.verify = ca_cert
+    if pool is not None:
+        pool.add(key, session)
 
     return session
 
@@ -151,38 +459,195 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
-def markdown_converter(description_html: str):
+@tracing.traced
+def markdown_converter(description_html):
+    """
+    Converts a description to markdown in one pass. HTML given as str or bytes is
+    parsed once, an already parsed Tag is converted directly instead of being parsed
+    again; either way the conversion is memoized by the content of the HTML.
+    :param description_html: str, bytes or bs4 Tag
+    """
     if description_html is None:
         return None
-    markdown = md(description_html)
+    with stats.stage("convert"):
+        return default_store.convert(description_html, "markdown", _to_markdown)
+
+
+def _to_markdown(description_html) -> str:
+    if isinstance(description_html, (str, bytes)):
+        description_html = parse_html(description_html)
+    markdown = _markdown().convert_soup(description_html)
     return markdown.strip()
 
-def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
+
+@tracing.traced
+def plain_converter(decription_html):
+    """
+    Converts a description to plain text, see markdown_converter for the input types
+    """
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
+    with stats.stage("convert"):
+        return default_store.convert(decription_html, "plain", _to_plain)
+
+
+def _to_plain(decription_html) -> str:
+    if isinstance(decription_html, (str, bytes)):
+        decription_html = parse_html(decription_html)
+    text = decription_html.get_text(separator=" ")
     text = re.sub(r'\s+',' ',text)
     return text.strip()
 
 
+_html_parser: str | None = None
+
+
+def set_html_parser(parser: str | None):
+    """
+    Sets the BeautifulSoup tree builder every scraper parses pages with
+    :param parser: "lxml", "html.parser" or "html5lib", None picks lxml when it is
+        installed (or the JOBSPY_HTML_PARSER environment variable) and falls back to
+        html.parser
+    """
+    global _html_parser
+    _html_parser = parser
+
+
+def get_html_parser() -> str:
+    global _html_parser
+    if _html_parser is None:
+        parser = os.environ.get("JOBSPY_HTML_PARSER")
+        if not parser:
+            try:
+                import lxml  # noqa: F401
+
+                parser = "lxml"
+            except ImportError:
+                parser = "html.parser"
+        _html_parser = parser
+    return _html_parser
+
+
+def parse_html(markup: str | bytes, parse_only=None, from_encoding: str | None = None):
+    """
+    Parses markup with the configured parser
+    :param parse_only: SoupStrainer restricting the tree to the targeted subtrees
+    :param from_encoding: encoding of bytes markup, sniffed from the markup if None
+    """
+    from bs4 import BeautifulSoup
+
+    if isinstance(markup, str):
+        from_encoding = None
+    with stats.stage("parse"), tracing.span("parse_html"):
+        return BeautifulSoup(
+            markup,
+            get_html_parser(),
+            parse_only=parse_only,
+            from_encoding=from_encoding,
+        )
+
+
+def parse_response(response, parse_only=None):
+    """
+    Parses the body of a response from its bytes, sparing the decode to str
+    """
+    return parse_html(
+        response.content,
+        parse_only=parse_only,
+        from_encoding=getattr(response, "encoding", None),
+    )
+
+
+SALARY_PATTERN = (
+    r"\$(?P<min_salary>\d+(?:,\d+)?(?:\.\d+)?)(?P<min_k>[kK]?)\s*[-—–]\s*(?:\$)?"
+    r"(?P<max_salary>\d+(?:,\d+)?(?:\.\d+)?)(?P<max_k>[kK]?)"
+)
+_EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# scanned apart from the emails, so keywords inside an address (remote-jobs@...)
+# still count. The lookahead on the first characters of the alternatives lets
+# the scan skip most positions without trying every branch
+_TEXT_FEATURES = re.compile(
+    r"(?=[$fpichrw])(?:"
+    rf"{SALARY_PATTERN}"
+    r"|(?P<full_time>full\s?time)"
+    r"|(?P<part_time>part\s?time)"
+    r"|(?P<internship>internship)"
+    r"|(?P<contract>contract)"
+    r"|(?P<hybrid>hybrid)"
+    r"|(?P<remote>remote)"
+    r"|(?P<work_from_home>work from home|wfh)"
+    r"|(?P<home_based>home based))",
+    re.IGNORECASE,
+)
+_JOB_TYPE_GROUPS = {
+    "full_time": JobType.FULL_TIME,
+    "part_time": JobType.PART_TIME,
+    "internship": JobType.INTERNSHIP,
+    "contract": JobType.CONTRACT,
+}
+
+
+class TextFeatures(NamedTuple):
+    emails: tuple[str, ...] = ()
+    job_types: tuple[JobType, ...] = ()
+    # min, min k suffix, max, max k suffix of the first salary range
+    salary: tuple[str, str, str, str] | None = None
+    remote: bool = False
+    work_from_home: bool = False
+    home_based: bool = False
+    hybrid: bool = False
+
+    @property
+    def is_remote(self) -> bool:
+        return self.remote or self.work_from_home
+
+
+def text_features(text: str | None) -> TextFeatures:
+    """
+    Scans a text for the emails, job types, first salary range and remote/hybrid
+    keywords it mentions, in one pass for the emails and one for everything else
+    """
+    if not text:
+        return TextFeatures()
+    job_types = []
+    salary = None
+    flags = set()
+    for match in _TEXT_FEATURES.finditer(text):
+        group = match.lastgroup
+        if group == "max_k":
+            if salary is None:
+                salary = match.group("min_salary", "min_k", "max_salary", "max_k")
+        elif group in _JOB_TYPE_GROUPS:
+            job_type = _JOB_TYPE_GROUPS[group]
+            if job_type not in job_types:
+                job_types.append(job_type)
+        else:
+            flags.add(group)
+    return TextFeatures(
+        emails=tuple(_EMAIL_PATTERN.findall(text)),
+        job_types=tuple(t for t in _JOB_TYPE_GROUPS.values() if t in job_types),
+        salary=salary,
+        remote="remote" in flags,
+        work_from_home="work_from_home" in flags,
+        home_based="home_based" in flags,
+        hybrid="hybrid" in flags,
+    )
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return _EMAIL_PATTERN.findall(text)
+
+
+_JOB_TYPE_INDEX = {value: job_type for job_type in JobType for value in job_type.value}
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
     """
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
+    return _JOB_TYPE_INDEX.get(job_type_str)
 
 
 def currency_parser(cur_str):
@@ -199,6 +664,8 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
+    import numpy as np
+
     return np.round(num, 2)
 
 
@@ -224,7 +691,6 @@ def extract_salary(
         return None, None, None, None
 
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -235,13 +701,13 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
+    match = text_features(salary_str).salary
 
     if match:
-        min_salary = to_int(match.group(1))
-        max_salary = to_int(match.group(3))
+        min_salary = to_int(match[0])
+        max_salary = to_int(match[2])
         # Handle 'k' suffix for min and max salaries independently
-        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
+        if "k" in match[1].lower() or "k" in match[3].lower():
             min_salary *= 1000
             max_salary *= 1000
 
@@ -278,22 +744,17 @@ def extract_salary(
     return None, None, None, None
 
 
-def extract_job_type(description: str):
+def extract_job_type(description: str, features: TextFeatures | None = None):
+    """
+    Job types mentioned in a description; pass the description's text_features
+    when they were already scanned to skip scanning it again
+    """
     if not description:
         return []
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
-
+    if features is None:
+        features = text_features(description)
+    listing_types = list(features.job_types)
     return listing_types if listing_types else None
 
 
@@ -302,10 +763,10 @@ def map_str_to_site(site_name: str) -> Site:
 
 
 def get_enum_from_value(value_str):
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
-    raise Exception(f"Invalid job type: {value_str}")
+    job_type = _JOB_TYPE_INDEX.get(value_str)
+    if job_type is None:
+        raise Exception(f"Invalid job type: {value_str}")
+    return job_type
 
 
 def convert_to_annual(job_data: dict):
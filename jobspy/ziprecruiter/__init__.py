@@ -3,20 +3,18 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
-    extract_emails_from_text,
+    text_features,
     create_session,
     markdown_converter,
     remove_attributes,
     create_logger,
+    parse_response,
 )
+from jobspy import stats, tracing
 from jobspy.model import (
     JobPost,
     Compensation,
@@ -36,21 +34,33 @@ log = create_logger("ZipRecruiter")
 class ZipRecruiter(Scraper):
     base_url = "https://www.ziprecruiter.com"
     api_url = "https://api.ziprecruiter.com"
+    rate_limit = 0.2  # initial search page requests per second, adapted to responses
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        **kwargs,
     ):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(Site.ZIP_RECRUITER, proxies=proxies, **kwargs)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            has_retry=True,
+            rate_limit=self.rate_limit,
+            **self.session_options,
+        )
         self.session.headers.update(headers)
-        self._get_cookies()
+        # a session reused from an earlier scrape already went through the bootstrap
+        if not self.session.reused:
+            self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
@@ -66,22 +76,22 @@ class ZipRecruiter(Scraper):
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if len(job_list) >= scraper_input.results_wanted or self.stopped:
                 break
-            if page > 1:
-                time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
             if jobs_on_page:
                 job_list.extend(jobs_on_page)
+                self.emit_jobs(job_list)
             else:
                 break
             if not continue_token:
                 break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
+    @tracing.traced
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
     ) -> tuple[list[JobPost], str | None]:
@@ -96,7 +106,9 @@ class ZipRecruiter(Scraper):
         if continue_token:
             params["continue_from"] = continue_token
         try:
-            res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
+            res = self.session.get(
+                f"{self.api_url}/jobs-app/jobs", params=params, kind="search"
+            )
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     err = "429 Response - Blocked by ZipRecruiter for too many requests"
@@ -115,10 +127,14 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
+        # known jobs are dropped before their descriptions are fetched, a page of
+        # only known jobs comes back empty and ends the search
+        known = self.known_ids([f"zr-{job['listing_key']}" for job in jobs_list])
+        jobs_list = [
+            job for job in jobs_list if f"zr-{job['listing_key']}" not in known
+        ]
+        job_results = self.scheduler.map(self._process_job, jobs_list)
+        job_list = list(filter(None, job_results))
         return job_list, next_continue_token
 
     def _process_job(self, job: dict) -> JobPost | None:
@@ -128,6 +144,7 @@ class ZipRecruiter(Scraper):
         title = job.get("name")
         job_url = f"{self.base_url}/jobs//j?lvk={job['listing_key']}"
         if job_url in self.seen_urls:
+            stats.count("duplicates_dropped")
             return
         self.seen_urls.add(job_url)
 
@@ -142,7 +159,7 @@ class ZipRecruiter(Scraper):
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
 
-        location = Location(
+        location = Location.create(
             city=job.get("job_city"), state=job.get("job_state"), country=country_enum
         )
         job_type = get_job_type_enum(
@@ -156,13 +173,13 @@ class ZipRecruiter(Scraper):
         comp_currency = job.get("compensation_currency")
         description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        return JobPost.create(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
             location=location,
             job_type=job_type,
-            compensation=Compensation(
+            compensation=Compensation.create(
                 interval=comp_interval,
                 min_amount=comp_min,
                 max_amount=comp_max,
@@ -171,29 +188,29 @@ class ZipRecruiter(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=list(text_features(description).emails) if description else None,
             job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
 
+    @tracing.traced
     def _get_descr(self, job_url):
-        res = self.session.get(job_url, allow_redirects=True)
+        res = self.session.get(job_url, allow_redirects=True, kind="detail")
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = parse_response(res)
             job_descr_div = soup.find("div", class_="job_description")
             company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
-            )
-            description_full = job_description_clean + company_description_clean
+            descr_tags = [tag for tag in (job_descr_div, company_descr_section) if tag]
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description_full = "\n\n".join(
+                    filter(None, map(markdown_converter, descr_tags))
+                )
+            else:
+                description_full = "".join(
+                    remove_attributes(tag).prettify(formatter="html")
+                    for tag in descr_tags
+                )
 
             try:
                 script_tag = soup.find("script", type="application/json")
@@ -206,9 +223,6 @@ class ZipRecruiter(Scraper):
             except:
                 job_url_direct = None
 
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
-
         return description_full, job_url_direct
 
     def _get_cookies(self):
@@ -1,4 +1,5 @@
 from jobspy.model import JobType
+from jobspy.util import get_enum_from_job_type
 
 
 def add_params(scraper_input) -> dict[str, str | int]:
@@ -25,7 +26,5 @@ def add_params(scraper_input) -> dict[str, str | int]:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
-    return None
+    job_type = get_enum_from_job_type(job_type_str)
+    return [job_type] if job_type else None
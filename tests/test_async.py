@@ -0,0 +1,42 @@
+import asyncio
+import inspect
+
+from jobspy import async_scrape_jobs, scrape_jobs
+from jobspy.model import SCRAPER_CLASSES, JobPost, JobResponse, Location, Scraper
+from jobspy.model import Site
+
+
+class StaticScraper(Scraper):
+    def __init__(self, **kwargs):
+        super().__init__(Site.BAYT, **kwargs)
+
+    def scrape(self, scraper_input):
+        return JobResponse(
+            jobs=[
+                JobPost(
+                    id=f"bayt-{i}",
+                    title="Engineer",
+                    company_name="Acme",
+                    job_url=f"https://example.com/{i}",
+                    location=Location(city="Dubai"),
+                )
+                for i in range(scraper_input.results_wanted)
+            ]
+        )
+
+
+def test_async_scrape_jobs_wraps_scrape_jobs(monkeypatch):
+    monkeypatch.setitem(SCRAPER_CLASSES, "bayt", (__name__, "StaticScraper"))
+    assert inspect.signature(async_scrape_jobs) == inspect.signature(scrape_jobs)
+
+    async def gather():
+        return await asyncio.gather(
+            *(async_scrape_jobs(site_name="bayt", results_wanted=n) for n in (2, 3))
+        )
+
+    first, second = asyncio.run(gather())
+    assert list(first["id"]) == ["bayt-0", "bayt-1"]
+    assert len(second) == 3
+    assert list(first.columns) == list(
+        scrape_jobs(site_name="bayt", results_wanted=2).columns
+    )
@@ -0,0 +1,67 @@
+import requests
+
+from jobspy.cache import HttpCache
+
+
+def make_response(content: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://example.com/jobs"
+    response.headers["Content-Type"] = "text/html; charset=utf-8"
+    response._content = content
+    return response
+
+
+def test_stored_response_is_served_back(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    key = cache.key("get", "https://example.com/jobs", {"q": "python"})
+    cache.set(key, make_response(b"<html>jobs</html>"))
+
+    response = cache.get(key, "search")
+    assert response.status_code == 200
+    assert response.content == b"<html>jobs</html>"
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.encoding == "utf-8"
+    assert cache.stats()["hits"] == 1
+
+
+def test_key_depends_on_the_request():
+    url = "https://example.com/jobs"
+    assert HttpCache.key("get", url, {"q": "a"}) != HttpCache.key(
+        "get", url, {"q": "b"}
+    )
+    assert HttpCache.key("get", url) != HttpCache.key("post", url)
+    assert HttpCache.key("GET", url) == HttpCache.key("get", url)
+
+
+def test_expired_and_failed_responses_are_misses(tmp_path):
+    cache = HttpCache(str(tmp_path), search_ttl=0)
+    cache.set("search", make_response(b"page"))
+    cache.set("error", make_response(b"blocked", status_code=429))
+
+    assert cache.get("search", "search") is None
+    assert cache.get("error", "detail") is None
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(str(tmp_path), max_bytes=10**6)
+    content = bytes(range(256)) * 40  # barely compressible
+    for key in ("a", "b", "c"):
+        cache.set(key, make_response(content + key.encode()))
+    cache.get("a", "detail")
+    cache.max_bytes = cache.stats()["bytes"] - 1
+    cache.set("d", make_response(content + b"d"))
+
+    assert cache.get("b", "detail") is None
+    assert cache.get("a", "detail") is not None
+    assert cache.get("d", "detail") is not None
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_entries_survive_reopening_the_store(tmp_path):
+    HttpCache(str(tmp_path)).set("key", make_response(b"page"))
+    cache = HttpCache(str(tmp_path))
+    assert cache.stats()["entries"] == 1
+    assert cache.get("key", "detail").content == b"page"
@@ -0,0 +1,152 @@
+import pandas as pd
+
+from jobspy.dedup import dedupe_jobs, duplicate_groups
+
+
+def frame(rows: list[dict]) -> pd.DataFrame:
+    columns = ["id", "site", "title", "company", "location", "job_url_direct"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_distinct_job_ids_in_the_query_are_not_merged():
+    jobs = frame(
+        [
+            {
+                "site": "linkedin",
+                "title": f"Engineer {i}",
+                "company": f"Company {i}",
+                "job_url_direct": f"https://www.indeed.com/viewjob?jk={i:016x}",
+            }
+            for i in range(30)
+        ]
+        + [
+            {
+                "site": "google",
+                "title": f"Analyst {i}",
+                "company": "Acme",
+                "job_url_direct": f"https://boards.greenhouse.io/acme/jobs?gh_jid={i}",
+            }
+            for i in range(30)
+        ]
+    )
+    assert duplicate_groups(jobs).nunique() == 60
+    assert len(dedupe_jobs(jobs, "collapse")) == 60
+
+
+def test_tracking_params_and_url_form_are_ignored():
+    jobs = frame(
+        [
+            {
+                "site": "linkedin",
+                "title": "Data Engineer",
+                "company": "Acme",
+                "job_url_direct": "https://acme.com/careers/job?id=7&utm_source=li",
+            },
+            {
+                "site": "google",
+                "title": "Sr. Data Engineer (Remote)",
+                "company": "Acme Corp",
+                "job_url_direct": "http://www.acme.com/careers/job/?id=7&gclid=x#apply",
+            },
+        ]
+    )
+    assert duplicate_groups(jobs).tolist() == [0, 0]
+
+
+def test_a_boards_own_pages_never_link_jobs():
+    jobs = frame(
+        [
+            {
+                "site": "indeed",
+                "title": "Nurse",
+                "company": "Clinic A",
+                "job_url_direct": "https://www.indeed.com/applystart",
+            },
+            {
+                "site": "indeed",
+                "title": "Driver",
+                "company": "Fleet B",
+                "job_url_direct": "https://www.indeed.com/applystart",
+            },
+        ]
+    )
+    assert duplicate_groups(jobs).tolist() == [0, 1]
+
+
+def test_same_posting_on_several_sites_is_collapsed():
+    jobs = frame(
+        [
+            {
+                "site": "indeed",
+                "title": "Software Engineer",
+                "company": "Acme, Inc.",
+                "location": "Austin, TX, US",
+            },
+            {
+                "site": "linkedin",
+                "title": "software engineer",
+                "company": "ACME",
+                "location": "Austin, Texas",
+                "job_url_direct": "https://acme.com/jobs/1",
+            },
+            {
+                "site": "glassdoor",
+                "title": "Designer",
+                "company": "Acme",
+                "location": "Austin, TX",
+            },
+        ]
+    )
+    assert duplicate_groups(jobs).tolist() == [0, 0, 1]
+    collapsed = dedupe_jobs(jobs, "collapse")
+    assert len(collapsed) == 2
+    assert collapsed.loc[0, "job_url_direct"] == "https://acme.com/jobs/1"
+
+
+def test_rows_of_one_site_with_distinct_ids_are_not_merged():
+    jobs = frame(
+        [
+            {"id": "in-1", "site": "indeed", "title": "Driver", "company": "Fleet"},
+            {"id": "in-2", "site": "indeed", "title": "Driver", "company": "Fleet"},
+            {"id": "li-1", "site": "linkedin", "title": "Driver", "company": "Fleet"},
+            {"id": "in-1", "site": "indeed", "title": "Driver", "company": "Fleet"},
+            {
+                "id": "go-1",
+                "site": "google",
+                "title": "Truck Driver",
+                "company": "Fleet",
+                "job_url_direct": "https://fleet.com/jobs/1",
+            },
+            {
+                "id": "go-2",
+                "site": "google",
+                "title": "Van Driver",
+                "company": "Fleet",
+                "job_url_direct": "https://fleet.com/jobs/1",
+            },
+        ]
+    )
+    assert duplicate_groups(jobs).tolist() == [0, 1, 0, 0, 2, 3]
+
+
+def test_query_values_are_case_sensitive():
+    jobs = frame(
+        [
+            {
+                "site": "linkedin",
+                "title": f"Engineer {i}",
+                "company": "Acme",
+                "job_url_direct": f"HTTPS://Jobs.Acme.com/apply?req={req}",
+            }
+            for i, req in enumerate(("aB3", "Ab3"))
+        ]
+        + [
+            {
+                "site": "google",
+                "title": "Engineer 0",
+                "company": "Other",
+                "job_url_direct": "https://jobs.acme.com/apply?req=aB3",
+            }
+        ]
+    )
+    assert duplicate_groups(jobs).tolist() == [0, 1, 0]
@@ -0,0 +1,59 @@
+import pytest
+
+from jobspy.description import DescriptionStore
+from jobspy.util import default_store, markdown_converter, parse_html
+
+
+def test_conversions_are_memoized():
+    store = DescriptionStore()
+    calls = []
+
+    def converter(html):
+        calls.append(html)
+        return html.upper()
+
+    assert store.convert("<p>a</p>", "markdown", converter) == "<P>A</P>"
+    assert store.convert("<p>a</p>", "markdown", converter) == "<P>A</P>"
+    assert store.convert("<p>a</p>", "plain", converter) == "<P>A</P>"
+    assert len(calls) == 2
+    assert (store.hits, store.misses) == (1, 2)
+
+
+def test_texts_are_kept_once_and_resolved():
+    store = DescriptionStore()
+    refs = [store.put("same"), store.put("same"), store.put(None)]
+    assert refs[0] == refs[1]
+    assert len(store) == 1
+    assert store.resolve(refs) == ["same", "same", None]
+
+
+def test_least_recently_used_texts_are_forgotten():
+    store = DescriptionStore(memo_size=2, max_texts=2)
+    first, second = store.put("first"), store.put("second")
+    store.get(first)
+    third = store.put("third")
+    assert len(store) == 2
+    assert store.resolve([first, third]) == ["first", "third"]
+    with pytest.raises(KeyError):
+        store.get(second)
+
+    for i in range(5):
+        store.convert(f"<p>{i}</p>", "plain", str)
+    assert len(store._memo) == 2
+
+
+def test_unbounded_store_keeps_every_text():
+    store = DescriptionStore(max_texts=None)
+    refs = [store.put(str(i)) for i in range(10)]
+    assert store.resolve(refs) == [str(i) for i in range(10)]
+
+
+def test_tag_conversions_share_the_memo_with_html():
+    html = "<div><p>Hello <b>world</b></p></div>"
+    tag = parse_html(html).find("div")
+    default_store.clear()
+    hits = default_store.hits
+    assert markdown_converter(tag) == "Hello **world**"
+    assert markdown_converter(str(tag)) == "Hello **world**"
+    assert markdown_converter(parse_html(html).find("div")) == "Hello **world**"
+    assert default_store.hits == hits + 2
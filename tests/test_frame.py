@@ -0,0 +1,137 @@
+from datetime import date
+
+import pytest
+
+from jobspy import scrape_jobs
+from jobspy.description import DescriptionStore
+from jobspy.frame import JobColumns, arrow_schema
+from jobspy.model import (
+    SCRAPER_CLASSES,
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobResponse,
+    JobType,
+    Location,
+    Scraper,
+    Site,
+)
+from jobspy.util import desired_order
+
+
+def make_job(i: int, **fields) -> JobPost:
+    return JobPost(
+        id=f"in-{i}",
+        title="Engineer",
+        company_name="Acme",
+        job_url=f"https://example.com/{i}",
+        location=Location(city="Austin", state="TX", country=Country.USA),
+        **fields,
+    )
+
+
+def test_rows_are_flattened_into_desired_order_columns():
+    jobs = JobColumns(country=Country.USA)
+    jobs.add_jobs(
+        "indeed",
+        [
+            make_job(
+                0,
+                date_posted=date(2024, 5, 1),
+                job_type=[JobType.FULL_TIME],
+                emails=["jobs@acme.com"],
+                compensation=Compensation(
+                    interval=CompensationInterval.YEARLY,
+                    min_amount=100000,
+                    max_amount=120000,
+                ),
+            ),
+            make_job(1, description="Pay is $40 - $50 an hour"),
+        ],
+    )
+    frame = jobs.to_pandas()
+
+    assert list(frame.columns) == desired_order
+    assert len(jobs) == len(frame) == 2
+    first = frame.iloc[0]
+    assert first["site"] == "indeed"
+    assert first["company"] == "Acme"
+    assert first["location"] == "Austin, TX, USA"
+    assert first["job_type"] == "fulltime"
+    assert first["emails"] == "jobs@acme.com"
+    assert first["salary_source"] == "direct_data"
+    # the second job's salary comes from its description
+    second = frame.iloc[1]
+    assert second["salary_source"] == "description"
+    assert (second["interval"], second["min_amount"]) == ("hourly", 40)
+    # columns no job has stay None
+    assert frame["company_rating"].isna().all()
+    assert frame["company_rating"].dtype == object
+
+
+def test_descriptions_are_kept_in_the_store():
+    store = DescriptionStore()
+    jobs = JobColumns(description_store=store)
+    jobs.add_jobs("linkedin", [make_job(i, description="same") for i in range(3)])
+    refs = jobs.to_pandas()["description"]
+
+    assert refs.nunique() == 1
+    assert store.resolve(refs) == ["same"] * 3
+
+
+def test_arrow_table_is_typed_by_the_schema():
+    pytest.importorskip("pyarrow")
+    jobs = JobColumns()
+    jobs.add_jobs(
+        "glassdoor",
+        [
+            make_job(0, is_remote=True, date_posted=date(2024, 5, 1)),
+            make_job(1, compensation=Compensation(min_amount=50000, max_amount=70000)),
+        ],
+    )
+    table = jobs.to_arrow()
+
+    assert table.schema == arrow_schema()
+    assert table.num_rows == 2
+    assert table.column("min_amount").to_pylist() == [None, 50000.0]
+    assert table.column("is_remote").to_pylist() == [True, None]
+
+
+def test_amounts_given_as_ints_stay_float():
+    compensation = Compensation.create(
+        interval="yearly", min_amount=90000, max_amount=110000
+    )
+    assert isinstance(compensation.min_amount, float)
+    jobs = JobColumns()
+    jobs.add_jobs("glassdoor", [make_job(0, compensation=compensation)])
+    frame = jobs.to_pandas()
+    assert frame["min_amount"].dtype == "float64"
+    assert frame["max_amount"].dtype == "float64"
+
+
+class StaticScraper(Scraper):
+    def __init__(self, **kwargs):
+        super().__init__(Site.GLASSDOOR, **kwargs)
+
+    def scrape(self, scraper_input):
+        return JobResponse(
+            jobs=[
+                make_job(0, is_remote=True, date_posted=date(2024, 5, 1)),
+                make_job(1, compensation=Compensation(min_amount=5e4, max_amount=7e4)),
+                make_job(2, is_remote=False, date_posted=date(2024, 5, 2)),
+            ]
+        )
+
+
+@pytest.mark.parametrize("dedupe", ["group", "collapse"])
+def test_deduplicated_tables_share_the_schema(monkeypatch, dedupe):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setitem(SCRAPER_CLASSES, "glassdoor", (__name__, "StaticScraper"))
+    table = scrape_jobs(site_name="glassdoor", output_format="arrow")
+    deduped = scrape_jobs(site_name="glassdoor", output_format="arrow", dedupe=dedupe)
+
+    assert table.schema == arrow_schema()
+    assert deduped.schema == arrow_schema(duplicate_group=True)
+    assert deduped.schema.remove(len(desired_order)) == table.schema
+    assert deduped.column("date_posted").to_pylist()[0] == date(2024, 5, 2)
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import requests
+
+from jobspy.hedge import HedgePolicy
+from jobspy.ratelimit import RateController
+from jobspy.scheduler import Scheduler
+from jobspy.util import create_session
+
+URL = "https://www.ziprecruiter.com/jobs/1"
+
+
+def make_response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b""
+    return response
+
+
+def warmed_up(**kwargs) -> HedgePolicy:
+    hedge = HedgePolicy(min_samples=5, max_ratio=1, **kwargs)
+    for _ in range(5):
+        hedge.send(URL, lambda: None)
+    return hedge
+
+
+def test_requests_run_inline_until_the_host_has_a_threshold():
+    hedge = HedgePolicy(min_samples=5)
+    threads = set()
+
+    def send(hedge=False):
+        threads.add(threading.current_thread())
+
+    for _ in range(4):
+        hedge.send(URL, send, submit=lambda *a, **k: 1 / 0)
+    assert threads == {threading.current_thread()}
+    assert hedge.stats()["www.ziprecruiter.com"]["threshold"] is None
+
+
+def test_slow_request_is_hedged_on_the_scheduler_pool():
+    scheduler = Scheduler(max_workers=4)
+    hedge = warmed_up(min_delay=0.05)
+    threads = []
+
+    def send(hedge=False):
+        threads.append(threading.current_thread().name)
+        if not hedge:
+            time.sleep(0.5)
+        return hedge
+
+    start = time.perf_counter()
+    assert hedge.send(URL, send, scheduler.submit) is True
+    assert time.perf_counter() - start < 0.4
+    assert all(name.startswith("jobspy-fetch") for name in threads)
+    assert hedge.stats()["www.ziprecruiter.com"]["hedges"] == 1
+    scheduler.shutdown()
+
+
+def test_request_queued_behind_a_saturated_pool_runs_inline():
+    scheduler = Scheduler(max_workers=1)
+    release = threading.Event()
+    scheduler.submit(release.wait, 5)
+    hedge = warmed_up(min_delay=0.05)
+
+    caller = threading.current_thread()
+    ran_on = []
+    hedge.send(
+        URL,
+        lambda hedge=False: ran_on.append(threading.current_thread()),
+        scheduler.submit,
+    )
+    assert ran_on == [caller]
+    release.set()
+    scheduler.shutdown()
+
+
+def dispatch_slow_request(max_per_host: int) -> tuple[float, int]:
+    """
+    :return: seconds the request took and the most requests in flight at once
+    """
+    scheduler = Scheduler(max_workers=4, max_per_host=max_per_host)
+    session = create_session(
+        is_tls=False,
+        scheduler=scheduler,
+        hedge=warmed_up(min_delay=0.05),
+        rate_controller=RateController(),
+    )
+    in_flight, most_in_flight = 0, 0
+    lock = threading.Lock()
+
+    def send(hedge=False):
+        nonlocal in_flight, most_in_flight
+        with lock:
+            in_flight += 1
+            most_in_flight = max(most_in_flight, in_flight)
+        time.sleep(0.05 if hedge else 0.5)
+        with lock:
+            in_flight -= 1
+        return make_response()
+
+    start = time.perf_counter()
+    assert session.dispatch("GET", URL, send, "detail", {}).ok
+    elapsed = time.perf_counter() - start
+    scheduler.shutdown()
+    return elapsed, most_in_flight
+
+
+def test_hedge_takes_a_request_slot_of_its_own():
+    elapsed, most_in_flight = dispatch_slow_request(max_per_host=2)
+    assert elapsed < 0.4
+    assert most_in_flight == 2
+    # with one slot per host the hedge waits for the slow request to end
+    elapsed, most_in_flight = dispatch_slow_request(max_per_host=1)
+    assert most_in_flight == 1
@@ -0,0 +1,42 @@
+import threading
+
+from jobspy import scrape_jobs_iter
+from jobspy.model import SCRAPER_CLASSES, JobPost, JobResponse, Location, Scraper
+from jobspy.model import Site
+
+pages_scraped = []
+finished = threading.Event()
+
+
+class EndlessScraper(Scraper):
+    def __init__(self, **kwargs):
+        super().__init__(Site.BAYT, **kwargs)
+
+    def scrape(self, scraper_input):
+        self.scraper_input = scraper_input
+        job_list = []
+        while len(job_list) < scraper_input.results_wanted and not self.stopped:
+            job_list.append(
+                JobPost(
+                    id=f"bayt-{len(job_list)}",
+                    title="Engineer",
+                    company_name="Acme",
+                    job_url=f"https://example.com/{len(job_list)}",
+                    location=Location(city="Dubai"),
+                )
+            )
+            pages_scraped.append(len(job_list))
+            self.emit_jobs(job_list)
+        finished.set()
+        return JobResponse(jobs=job_list)
+
+
+def test_closing_the_iterator_stops_the_scraper(monkeypatch):
+    monkeypatch.setitem(SCRAPER_CLASSES, "bayt", (__name__, "EndlessScraper"))
+    batches = scrape_jobs_iter(site_name="bayt", results_wanted=100_000)
+    first = next(batches)
+    assert len(first) == 1
+    batches.close()
+    assert finished.wait(5)
+    # the bounded queue held the scraper back while nothing was consumed
+    assert len(pages_scraped) < 100
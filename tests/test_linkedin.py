@@ -0,0 +1,37 @@
+import pytest
+from bs4 import SoupStrainer
+
+from jobspy.linkedin import _is_search_card
+from jobspy import util
+from jobspy.util import parse_html
+
+SEARCH_PAGE = b"""
+<li>
+  <div class="base-card relative w-full base-search-card base-search-card--link
+      job-search-card" data-entity-urn="urn:li:jobPosting:3693012711">
+    <h3 class="base-search-card__title">Software Engineer</h3>
+  </div>
+</li>
+<li>
+  <div class="base-search-card" data-entity-urn="urn:li:jobPosting:3696158877">
+    <h3 class="base-search-card__title">Full-Stack Engineer</h3>
+  </div>
+</li>
+<li><div class="base-search-card__info">not a card</div></li>
+"""
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_search_cards_with_several_classes_are_parsed(parser, monkeypatch):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(util, "_html_parser", parser)
+    soup = parse_html(
+        SEARCH_PAGE,
+        parse_only=SoupStrainer("div", class_=_is_search_card),
+    )
+    cards = soup.find_all("div", class_="base-search-card")
+    assert [card["data-entity-urn"][-10:] for card in cards] == [
+        "3693012711",
+        "3696158877",
+    ]
@@ -0,0 +1,68 @@
+from jobspy.proxies import ProxyPool, format_proxy
+
+URL = "https://www.linkedin.com/jobs/view/1"
+
+
+def test_format_proxy():
+    assert format_proxy("localhost") == {}
+    assert format_proxy("1.2.3.4:80") == {
+        "http": "http://1.2.3.4:80",
+        "https": "http://1.2.3.4:80",
+    }
+    assert format_proxy("socks5://1.2.3.4:1080")["https"] == "socks5://1.2.3.4:1080"
+
+
+def test_failing_proxy_is_ejected_from_the_host_only():
+    pool = ProxyPool(["a:1", "b:1"], eject_after=2, cooldown=60)
+    pool.observe("a:1", URL, 429, 0.1)
+    pool.observe("a:1", URL, None, 0.1)
+
+    assert {pool.choose(URL) for _ in range(50)} == {"b:1"}
+    assert pool.stats()["a:1"]["www.linkedin.com"]["ejected"]
+    assert pool.stats()["a:1"]["www.linkedin.com"]["throttled"] == 1
+    assert "a:1" in {pool.choose("https://www.indeed.com/") for _ in range(200)}
+
+
+def test_ejected_proxy_gets_one_probe_after_the_cooldown():
+    pool = ProxyPool(["a:1", "b:1"], eject_after=2, cooldown=0)
+    for _ in range(2):
+        pool.observe("a:1", URL, 503, 0.1)
+    health = pool._health[("a:1", "www.linkedin.com")]
+    assert health.ejections == 1
+
+    pool.observe("a:1", URL, 503, 0.1)
+    assert health.ejections == 2
+    pool.observe("a:1", URL, 200, 0.1)
+    assert (health.ejections, health.consecutive_errors) == (0, 0)
+
+
+def test_every_proxy_ejected_falls_back_to_the_first_one_back():
+    pool = ProxyPool(["a:1", "b:1"], eject_after=1, cooldown=60)
+    pool.observe("a:1", URL, None, 0.1)
+    pool.observe("b:1", URL, None, 0.1)
+    pool._health[("b:1", "www.linkedin.com")].ejected_until -= 30
+    assert pool.choose(URL) == "b:1"
+
+
+def test_affinity_sticks_to_a_healthy_proxy():
+    pool = ProxyPool(["a:1", "b:1", "c:1"], eject_after=1, max_affinities=2)
+    proxy = pool.choose(URL, affinity="page-1")
+    assert {pool.choose(URL, affinity="page-1") for _ in range(20)} == {proxy}
+
+    pool.observe(proxy, URL, 403, 0.1)
+    assert pool.choose(URL, affinity="page-1") != proxy
+
+    pool.choose(URL, affinity="page-2")
+    pool.choose(URL, affinity="page-3")
+    assert "page-1" not in pool._affinities
+
+
+def test_exclude_picks_another_proxy_when_there_is_one():
+    pool = ProxyPool(["a:1", "b:1"])
+    assert {pool.choose(URL, exclude="a:1") for _ in range(20)} == {"b:1"}
+    assert ProxyPool(["a:1"]).choose(URL, exclude="a:1") == "a:1"
+
+
+def test_shared_pool_per_proxy_list():
+    assert ProxyPool.shared(["x:1", "y:1"]) is ProxyPool.shared(["x:1", "y:1"])
+    assert ProxyPool.shared("x:1") is not ProxyPool.shared(["x:1", "y:1"])
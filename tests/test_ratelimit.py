@@ -0,0 +1,21 @@
+from jobspy.ratelimit import RateController
+
+URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DETAIL_URL = "https://www.linkedin.com/jobs/view/123"
+
+
+def test_detail_requests_are_paced_apart_from_search_pages():
+    controller = RateController()
+    search = controller.bucket(URL, 0.2)
+    detail = controller.bucket(DETAIL_URL, kind="detail")
+    assert detail is not search
+    assert search.rate == 0.2
+    assert detail.rate is None
+
+
+def test_throttled_detail_requests_slow_down_only_detail_requests():
+    controller = RateController()
+    controller.acquire(URL, 0.2)
+    controller.observe(DETAIL_URL, 429, {"Retry-After": "1"}, kind="detail")
+    assert controller.bucket(DETAIL_URL, kind="detail").rate == 0.5
+    assert controller.bucket(URL).rate == 0.2
@@ -0,0 +1,62 @@
+import pytest
+import requests
+
+from jobspy.exception import ReplayException
+from jobspy.replay import HttpArchive
+
+URL = "https://example.com/jobs"
+
+
+def make_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = URL
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    archive = HttpArchive(path, mode="record")
+    for query, body in (("a", b"a1"), ("a", b"a2"), ("b", b"b1"), ("c", b"c1")):
+        archive.record("get", URL, {"params": {"q": query}}, make_response(body))
+    return path
+
+
+def replay(archive: HttpArchive, query: str) -> bytes:
+    return archive.replay("get", URL, {"params": {"q": query}}).content
+
+
+def test_recorded_responses_are_replayed_in_order(archive_path):
+    archive = HttpArchive(archive_path)
+    assert [replay(archive, "a") for _ in range(3)] == [b"a1", b"a2", b"a2"]
+    assert replay(archive, "b") == b"b1"
+
+
+def test_unrecorded_requests_fail_by_default(archive_path):
+    archive = HttpArchive(archive_path)
+    with pytest.raises(ReplayException):
+        replay(archive, "z")
+    assert archive.stats()["misses"] == 1
+    assert archive.stats()["fallbacks"] == 0
+
+
+def test_fallback_only_serves_responses_not_replayed_yet(archive_path):
+    archive = HttpArchive(archive_path, fallback=True)
+    assert replay(archive, "a") == b"a1"
+    assert replay(archive, "b") == b"b1"
+    # a1 and b1 are consumed, a2 is the next one recorded for the path
+    assert replay(archive, "y") == b"a2"
+    assert replay(archive, "z") == b"c1"
+    with pytest.raises(ReplayException):
+        replay(archive, "x")
+    # exact requests still get their own responses
+    assert replay(archive, "a") == b"a2"
+    assert replay(archive, "c") == b"c1"
+    assert archive.stats() == {
+        "recorded": 0,
+        "replayed": 6,
+        "fallbacks": 2,
+        "misses": 1,
+    }
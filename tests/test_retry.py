@@ -0,0 +1,82 @@
+import requests
+
+from jobspy.ratelimit import RateController
+from jobspy.retry import CircuitBreaker, RetryPolicy
+from jobspy.util import create_session
+
+URL = "https://api.ziprecruiter.com/jobs-app/jobs"
+
+
+def make_response(status_code: int, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b""
+    return response
+
+
+def test_breaker_opens_after_threshold_and_closes_on_a_trial_success():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=0)
+    breaker.record(False)
+    assert not breaker.open
+    breaker.record(False)
+    assert breaker.open
+    # one trial once the timeout passed, the others keep failing fast
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record(True)
+    assert not breaker.open and breaker.allow()
+
+
+def test_backoff_is_jittered_capped_and_budgeted():
+    policy = RetryPolicy(attempts=3, base_delay=1, max_delay=4, budget=2)
+    delay = policy.backoff(1, 0)
+    assert 1 <= delay <= 4
+    assert policy.backoff(3, delay) is None  # out of attempts
+    assert policy.backoff(2, 10) == 4
+    assert policy.backoff(1, 0) is None  # out of budget
+    assert policy.stats()["exhausted"] == 1
+
+
+def test_retry_after_is_honoured_unless_too_long():
+    policy = RetryPolicy(max_retry_after=30)
+    assert policy.backoff(1, 0, make_response(429, {"Retry-After": "20"})) == 20
+    assert policy.backoff(1, 0, make_response(429, {"Retry-After": "60"})) is None
+
+
+def session(policy: RetryPolicy, has_retry: bool = True):
+    return create_session(
+        is_tls=False,
+        has_retry=has_retry,
+        retry=policy,
+        # throttled hosts aren't slowed down to a crawl in the tests
+        rate_controller=RateController(min_rate=1000),
+    )
+
+
+def test_open_circuit_returns_a_failed_response_without_sending():
+    policy = RetryPolicy(attempts=2, base_delay=0, max_delay=0, breaker_threshold=2)
+    retrying = session(policy)
+    sent = []
+
+    def send():
+        sent.append(1)
+        return make_response(503)
+
+    for _ in range(2):
+        assert retrying.dispatch("GET", URL, send, None, {}).status_code == 503
+    assert len(sent) == 4
+    assert policy.stats()["open_circuits"] == ["api.ziprecruiter.com"]
+
+    response = retrying.dispatch("GET", URL, send, None, {})
+    assert not response.ok
+    assert len(sent) == 4
+
+
+def test_sessions_without_retries_leave_the_breakers_alone():
+    policy = RetryPolicy(breaker_threshold=1)
+    plain = session(policy, has_retry=False)
+    for _ in range(3):
+        plain.dispatch("GET", URL, lambda: make_response(503), None, {})
+    assert policy.stats()["open_circuits"] == []
+    assert plain.dispatch("GET", URL, lambda: make_response(200), None, {}).ok
@@ -0,0 +1,37 @@
+import threading
+
+from jobspy.scheduler import Scheduler
+
+
+def test_requests_queued_on_a_host_leave_the_global_slots_free():
+    scheduler = Scheduler(max_in_flight=2, max_per_host=1)
+    busy = threading.Event()
+    release = threading.Event()
+    acquired = threading.Event()
+
+    def slow():
+        with scheduler.slot("https://slow.example.com/"):
+            busy.set()
+            release.wait(5)
+
+    def fast():
+        with scheduler.slot("https://fast.example.com/"):
+            acquired.set()
+
+    threads = [threading.Thread(target=slow) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    busy.wait(5)
+    threads.append(threading.Thread(target=fast))
+    threads[-1].start()
+    assert acquired.wait(2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    scheduler.shutdown()
+
+
+def test_max_host_connections_covers_the_busiest_host():
+    assert Scheduler(max_per_host=4).max_host_connections == 4
+    scheduler = Scheduler(max_in_flight=12, host_limits={"www.linkedin.com": 16})
+    assert scheduler.max_host_connections == 12
@@ -0,0 +1,44 @@
+from jobspy.linkedin.util import is_job_remote
+from jobspy.model import JobType, Location
+from jobspy.util import extract_emails_from_text, extract_job_type, text_features
+
+
+def test_keywords_inside_emails_are_found():
+    features = text_features("Send your CV to remote-jobs@acme.com")
+    assert features.emails == ("remote-jobs@acme.com",)
+    assert features.is_remote
+
+    features = text_features("Questions? contracts@acme.com or hr@acme.com")
+    assert features.emails == ("contracts@acme.com", "hr@acme.com")
+    assert features.job_types == (JobType.CONTRACT,)
+
+
+def test_salary_job_types_and_flags():
+    features = text_features(
+        "Hybrid part time internship paying $20 - $25.50 an hour, " "then $80k-$90k"
+    )
+    assert features.salary == ("20", "", "25.50", "")
+    assert features.job_types == (JobType.PART_TIME, JobType.INTERNSHIP)
+    assert features.hybrid
+    assert not features.is_remote
+    assert text_features("Work from home").is_remote
+    assert text_features(None) == text_features("")
+
+
+def test_extract_emails_from_text():
+    assert extract_emails_from_text("") is None
+    assert extract_emails_from_text("nothing here") == []
+    assert extract_emails_from_text("a.b@c.io, x@y.org") == ["a.b@c.io", "x@y.org"]
+
+
+def test_helpers_reuse_description_features():
+    description = "Full time, work from home"
+    features = text_features(description)
+    assert extract_job_type(description, features) == [JobType.FULL_TIME]
+    assert extract_job_type(description) == [JobType.FULL_TIME]
+    assert extract_job_type("", features) == []
+
+    location = Location(city="Austin", state="TX")
+    assert is_job_remote("Engineer", features, location)
+    assert not is_job_remote("Engineer", text_features(None), location)
+    assert is_job_remote("Remote engineer", text_features(None), location)